@@ -1,22 +1,28 @@
 import os
 import sys
 import re
-from datetime import datetime
+import mmap
+import time
+from functools import lru_cache
+from itertools import islice, groupby
+from collections import deque
+from operator import itemgetter
+from types import MappingProxyType
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple, Iterable
 import shutil
 from PyQt6.QtCore import QSettings
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QFormLayout, QGroupBox, QPushButton, QLineEdit, QCheckBox,
-    QLabel, QFileDialog, QMessageBox, QDialog, QTextEdit,
-    QTreeWidget, QTreeWidgetItem, QFrame, QScrollArea, QRadioButton, QButtonGroup
+    QLabel, QFileDialog, QMessageBox, QDialog, QPlainTextEdit,
+    QTreeWidget, QTreeWidgetItem, QTreeView, QHeaderView, QFrame, QScrollArea, QRadioButton, QButtonGroup
 )
-from PyQt6.QtCore import QObject, QThread, pyqtSignal, QTimer, Qt
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot, QTimer, Qt, QAbstractItemModel, QModelIndex, QMetaObject
 from PyQt6.QtGui import QFont
 
-from collections import defaultdict
 
 LANGUAGES = {
     'window_title': {'ru': 'Replitex', 'en': 'Replitex'},
@@ -137,32 +143,633 @@ LANGUAGES = {
     'critical_error': {'ru': 'Критическая ошибка: {error}', 'en': 'Critical error: {error}'}
 }
 
+@dataclass(frozen=True, slots=True)
+class ThemeColors:
+    main_bg: str
+    text_color: str
+    group_border: str
+    group_title: str
+    button_bg: str
+    button_border: str
+    button_hover_bg: str
+    button_hover_border: str
+    button_pressed_bg: str
+    button_pressed_border: str
+    button_disabled_bg: str
+    button_disabled_border: str
+    button_disabled_text: str
+    input_bg: str
+    input_border: str
+    input_focus_border: str
+    input_disabled_bg: str
+    input_disabled_text: str
+    selection_bg: str
+    checkbox_bg: str
+    checkbox_border: str
+    checkbox_checked_bg: str
+    checkbox_checked_border: str
+    checkbox_hover_border: str
+    checkbox_disabled_bg: str
+    checkbox_disabled_border: str
+    checkbox_disabled_text: str
+    label_text: str
+    text_edit_bg: str
+    text_edit_border: str
+    tree_bg: str
+    tree_border: str
+    tree_alternate_bg: str
+    tree_item_selected_bg: str
+    tree_item_hover_bg: str
+    header_bg: str
+    header_border: str
+    frame_line: str
+    msgbox_bg: str
+    scroll_bg: str
+    scroll_handle_bg: str
+    scroll_handle_hover_bg: str
+    scroll_handle_pressed_bg: str
+    radio_bg: str
+    radio_border: str
+    radio_checked_bg: str
+    radio_checked_border: str
+    radio_hover_border: str
+    status_success: str
+    status_error: str
+
+_THEMES = MappingProxyType({
+    "dark": ThemeColors(
+        main_bg='#2b2b2b',
+        text_color='#ffffff',
+        group_border='#555555',
+        group_title='#ffffff',
+        button_bg='#404040',
+        button_border='#606060',
+        button_hover_bg='#505050',
+        button_hover_border='#707070',
+        button_pressed_bg='#353535',
+        button_pressed_border='#808080',
+        button_disabled_bg='#2a2a2a',
+        button_disabled_border='#404040',
+        button_disabled_text='#666666',
+        input_bg='#3a3a3a',
+        input_border='#555555',
+        input_focus_border='#0078d4',
+        input_disabled_bg='#2a2a2a',
+        input_disabled_text='#666666',
+        selection_bg='#0078d4',
+        checkbox_bg='#3a3a3a',
+        checkbox_border='#555555',
+        checkbox_checked_bg='#0078d4',
+        checkbox_checked_border='#0078d4',
+        checkbox_hover_border='#999999',
+        checkbox_disabled_bg='#2a2a2a',
+        checkbox_disabled_border='#404040',
+        checkbox_disabled_text='#666666',
+        label_text='#ffffff',
+        text_edit_bg='#3a3a3a',
+        text_edit_border='#555555',
+        tree_bg='#3a3a3a',
+        tree_border='#555555',
+        tree_alternate_bg='#404040',
+        tree_item_selected_bg='#0078d4',
+        tree_item_hover_bg='#505050',
+        header_bg='#404040',
+        header_border='#555555',
+        frame_line='#555555',
+        msgbox_bg='#2b2b2b',
+        scroll_bg='#2b2b2b',
+        scroll_handle_bg='#555555',
+        scroll_handle_hover_bg='#666666',
+        scroll_handle_pressed_bg='#777777',
+        radio_bg='#3a3a3a',
+        radio_border='#555555',
+        radio_checked_bg='#0078d4',
+        radio_checked_border='#0078d4',
+        radio_hover_border='#707070',
+        status_success='#00aa00',
+        status_error='#ff6666'
+    ),
+    "light": ThemeColors(
+        main_bg='#f5f5f5',
+        text_color='#333333',
+        group_border='#cccccc',
+        group_title='#333333',
+        button_bg='#e0e0e0',
+        button_border='#aaaaaa',
+        button_hover_bg='#d0d0d0',
+        button_hover_border='#999999',
+        button_pressed_bg='#c0c0c0',
+        button_pressed_border='#888888',
+        button_disabled_bg='#e0e0e0',
+        button_disabled_border='#cccccc',
+        button_disabled_text='#999999',
+        input_bg='#ffffff',
+        input_border='#cccccc',
+        input_focus_border='#3399ff',
+        input_disabled_bg='#f0f0f0',
+        input_disabled_text='#999999',
+        selection_bg='#3399ff',
+        checkbox_bg='#ffffff',
+        checkbox_border='#cccccc',
+        checkbox_checked_bg='#3399ff',
+        checkbox_checked_border='#3399ff',
+        checkbox_hover_border='#999999',
+        checkbox_disabled_bg='#e0e0e0',
+        checkbox_disabled_border='#cccccc',
+        checkbox_disabled_text='#999999',
+        label_text='#333333',
+        text_edit_bg='#ffffff',
+        text_edit_border='#cccccc',
+        tree_bg='#ffffff',
+        tree_border='#cccccc',
+        tree_alternate_bg='#f0f0f0',
+        tree_item_selected_bg='#3399ff',
+        tree_item_hover_bg='#e0e0e0',
+        header_bg='#e0e0e0',
+        header_border='#cccccc',
+        frame_line='#cccccc',
+        msgbox_bg='#f5f5f5',
+        scroll_bg='#f5f5f5',
+        scroll_handle_bg='#cccccc',
+        scroll_handle_hover_bg='#bbbbbb',
+        scroll_handle_pressed_bg='#aaaaaa',
+        radio_bg='#ffffff',
+        radio_border='#cccccc',
+        radio_checked_bg='#3399ff',
+        radio_checked_border='#3399ff',
+        radio_hover_border='#999999',
+        status_success='#00aa00',
+        status_error='#ff6666'
+    ),
+    "poisonous_purple": ThemeColors(
+        main_bg='#592563',
+        text_color='#ffffff',
+        group_border='#b049c4',
+        group_title='#a4db59',
+        button_bg='#000000',
+        button_border='#c753dd',
+        button_hover_bg='#a645b8',
+        button_hover_border='#e860ff',
+        button_pressed_bg='#6e2e7a',
+        button_pressed_border='#ff6eff',
+        button_disabled_bg='#572461',
+        button_disabled_border='#843793',
+        button_disabled_text='#d358eb',
+        input_bg='#783286',
+        input_border='#b049c4',
+        input_focus_border='#a4db59',
+        input_disabled_bg='#572461',
+        input_disabled_text='#d358eb',
+        selection_bg='#a4db59',
+        checkbox_bg='#783286',
+        checkbox_border='#b049c4',
+        checkbox_checked_bg='#a4db59',
+        checkbox_checked_border='#a4db59',
+        checkbox_hover_border='#ff84ff',
+        checkbox_disabled_bg='#572461',
+        checkbox_disabled_border='#843793',
+        checkbox_disabled_text='#d358eb',
+        label_text='#ffffff',
+        text_edit_bg='#783286',
+        text_edit_border='#b049c4',
+        tree_bg='#783286',
+        tree_border='#b049c4',
+        tree_alternate_bg='#843793',
+        tree_item_selected_bg='#a4db59',
+        tree_item_hover_bg='#a645b8',
+        header_bg='#843793',
+        header_border='#b049c4',
+        frame_line='#b049c4',
+        msgbox_bg='#592563',
+        scroll_bg='#592563',
+        scroll_handle_bg='#b049c4',
+        scroll_handle_hover_bg='#d358eb',
+        scroll_handle_pressed_bg='#f666ff',
+        radio_bg='#783286',
+        radio_border='#b049c4',
+        radio_checked_bg='#a4db59',
+        radio_checked_border='#a4db59',
+        radio_hover_border='#e860ff',
+        status_success='#00aa00',
+        status_error='#ff6666'
+    ),
+    "midnight_gold": ThemeColors(
+        main_bg='#1a1f3a',
+        text_color='#ffffff',
+        group_border='#4a5a8a',
+        group_title='#ffd700',
+        button_bg='#2c3a6b',
+        button_border='#4a5a8a',
+        button_hover_bg='#3d4b7c',
+        button_hover_border='#5a6a9a',
+        button_pressed_bg='#1f2d5e',
+        button_pressed_border='#6a7aaa',
+        button_disabled_bg='#141829',
+        button_disabled_border='#2c3a6b',
+        button_disabled_text='#5a6a9a',
+        input_bg='#243456',
+        input_border='#4a5a8a',
+        input_focus_border='#ffd700',
+        input_disabled_bg='#141829',
+        input_disabled_text='#5a6a9a',
+        selection_bg='#ffd700',
+        checkbox_bg='#243456',
+        checkbox_border='#4a5a8a',
+        checkbox_checked_bg='#ffd700',
+        checkbox_checked_border='#ffed4a',
+        checkbox_hover_border='#8a9aca',
+        checkbox_disabled_bg='#141829',
+        checkbox_disabled_border='#2c3a6b',
+        checkbox_disabled_text='#5a6a9a',
+        label_text='#ffffff',
+        text_edit_bg='#243456',
+        text_edit_border='#4a5a8a',
+        tree_bg='#243456',
+        tree_border='#4a5a8a',
+        tree_alternate_bg='#2c3a6b',
+        tree_item_selected_bg='#ffd700',
+        tree_item_hover_bg='#3d4b7c',
+        header_bg='#2c3a6b',
+        header_border='#4a5a8a',
+        frame_line='#4a5a8a',
+        msgbox_bg='#1a1f3a',
+        scroll_bg='#1a1f3a',
+        scroll_handle_bg='#4a5a8a',
+        scroll_handle_hover_bg='#5a6a9a',
+        scroll_handle_pressed_bg='#6a7aaa',
+        radio_bg='#243456',
+        radio_border='#4a5a8a',
+        radio_checked_bg='#ffd700',
+        radio_checked_border='#ffed4a',
+        radio_hover_border='#5a6a9a',
+        status_success='#00ff88',
+        status_error='#ff4466'
+    )
+})
+
+_QSS_TEMPLATE = """
+        QMainWindow, QDialog, QWidget {{
+            background-color: {c.main_bg};
+            color: {c.text_color};
+            font-family: 'Segoe UI', Arial, sans-serif;
+            font-size: 9pt;
+        }}
+        QGroupBox {{
+            font-weight: bold;
+            border: 2px solid {c.group_border};
+            border-radius: 8px;
+            margin-top: 1ex;
+            padding-top: 10px;
+        }}
+        QGroupBox::title {{
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 10px 0 10px;
+            color: {c.group_title};
+        }}
+        QPushButton {{
+            background-color: {c.button_bg};
+            border: 1px solid {c.button_border};
+            border-radius: 8px;
+            padding: 8px 16px;
+            font-weight: bold;
+            min-width: 80px;
+        }}
+        QPushButton:hover {{
+            background-color: {c.button_hover_bg};
+            border-color: {c.button_hover_border};
+        }}
+        QPushButton:pressed {{
+            background-color: {c.button_pressed_bg};
+            border-color: {c.button_pressed_border};
+        }}
+        QPushButton:disabled {{
+            background-color: {c.button_disabled_bg};
+            border-color: {c.button_disabled_border};
+            color: {c.button_disabled_text};
+        }}
+        QPushButton#settings_btn {{
+            background-color: {c.button_bg};
+            border: 1px solid {c.button_border};
+            border-radius: 15px;
+            font-size: 16pt;
+            padding: 0;
+            min-width: 30px;
+            max-width: 30px;
+            min-height: 30px;
+            max-height: 30px;
+        }}
+        QPushButton#settings_btn:hover {{
+            background-color: {c.button_hover_bg};
+            border-color: {c.button_hover_border};
+        }}
+        QPushButton#settings_btn:pressed {{
+            background-color: {c.button_pressed_bg};
+            border-color: {c.button_pressed_border};
+        }}
+        QLineEdit {{
+            background-color: {c.input_bg};
+            border: 1px solid {c.input_border};
+            border-radius: 4px;
+            padding: 6px;
+            selection-background-color: {c.selection_bg};
+        }}
+        QLineEdit:focus {{
+            border-color: {c.input_focus_border};
+        }}
+        QLineEdit:disabled {{
+            background-color: {c.input_disabled_bg};
+            color: {c.input_disabled_text};
+        }}
+        QCheckBox {{
+            spacing: 8px;
+        }}
+        QCheckBox::indicator {{
+            width: 16px;
+            height: 16px;
+            border: 1px solid {c.checkbox_border};
+            background-color: {c.checkbox_bg};
+            border-radius: 2px;
+        }}
+        QCheckBox::indicator:checked {{
+            background-color: {c.checkbox_checked_bg};
+            border-color: {c.checkbox_checked_border};
+            image: url(:/check.png);
+        }}
+        QCheckBox::indicator:hover {{
+            border-color: {c.checkbox_hover_border};
+        }}
+        QCheckBox:disabled {{
+            color: {c.checkbox_disabled_text};
+        }}
+        QCheckBox::indicator:disabled {{
+            background-color: {c.checkbox_disabled_bg};
+            border-color: {c.checkbox_disabled_border};
+        }}
+        QCheckBox#theme_toggle::indicator {{
+            width: 40px;
+            height: 20px;
+            border-radius: 10px;
+            background-color: {c.checkbox_border};
+            border: 1px solid {c.checkbox_hover_border};
+        }}
+        QCheckBox#theme_toggle::indicator:checked {{
+            background-color: {c.checkbox_checked_bg};
+            border: 1px solid {c.checkbox_checked_border};
+        }}
+        QCheckBox#theme_toggle::indicator::subcontrol {{
+            width: 16px;
+            height: 16px;
+            border-radius: 8px;
+            background-color: {c.text_color};
+            border: 1px solid {c.checkbox_border};
+            subcontrol-origin: padding;
+            subcontrol-position: right center;
+            padding-right: 3px;
+            padding-top: 2px;
+        }}
+        QCheckBox#theme_toggle::indicator:checked::subcontrol {{
+            padding-right: 21px;
+            padding-left: 3px;
+        }}
+        QCheckBox#theme_toggle::indicator:hover {{
+            border-color: {c.checkbox_hover_border};
+        }}
+        QCheckBox#theme_toggle::indicator:disabled {{
+            background-color: {c.checkbox_disabled_bg};
+            border-color: {c.checkbox_disabled_border};
+        }}
+        QLabel {{
+            color: {c.label_text};
+        }}
+        QLabel#folderPathLabel {{
+            font-style: italic;
+        }}
+        QLabel#folderPathLabel[selected="true"] {{
+            font-style: normal;
+        }}
+        QLabel#statusLabel {{
+            padding: 5px;
+            color: {c.status_success};
+        }}
+        QLabel#statusLabel[state="error"] {{
+            color: {c.status_error};
+        }}
+        QPlainTextEdit {{
+            background-color: {c.text_edit_bg};
+            border: 1px solid {c.text_edit_border};
+            border-radius: 4px;
+            selection-background-color: {c.selection_bg};
+            font-family: 'Consolas', 'Courier New', monospace;
+        }}
+        QTreeView {{
+            background-color: {c.tree_bg};
+            border: 1px solid {c.tree_border};
+            border-radius: 4px;
+            selection-background-color: {c.tree_item_selected_bg};
+            alternate-background-color: {c.tree_alternate_bg};
+        }}
+        QTreeView::item {{
+            padding: 4px;
+            border: none;
+        }}
+        QTreeView::item:selected {{
+            background-color: {c.tree_item_selected_bg};
+        }}
+        QTreeView::item:hover {{
+            background-color: {c.tree_item_hover_bg};
+        }}
+        QHeaderView::section {{
+            background-color: {c.header_bg};
+            border: 1px solid {c.header_border};
+            padding: 6px;
+            font-weight: bold;
+        }}
+        QFrame[frameShape="4"] {{
+            border: none;
+            border-top: 1px solid {c.frame_line};
+        }}
+        QMessageBox {{
+            background-color: {c.msgbox_bg};
+        }}
+        QMessageBox QPushButton {{
+            min-width: 60px;
+            padding: 6px 12px;
+        }}
+        QScrollArea {{
+            background-color: {c.scroll_bg};
+            border: none;
+        }}
+        QScrollBar:vertical {{
+            background-color: {c.scroll_bg};
+            width: 12px;
+            border-radius: 6px;
+            margin: 0;
+        }}
+        QScrollBar::handle:vertical {{
+            background-color: {c.scroll_handle_bg};
+            border-radius: 6px;
+            min-height: 20px;
+            margin: 2px;
+        }}
+        QScrollBar::handle:vertical:hover {{
+            background-color: {c.scroll_handle_hover_bg};
+        }}
+        QScrollBar::handle:vertical:pressed {{
+            background-color: {c.scroll_handle_pressed_bg};
+        }}
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+            border: none;
+            background: none;
+            height: 0px;
+        }}
+        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
+            background: none;
+        }}
+        QScrollBar:horizontal {{
+            background-color: {c.scroll_bg};
+            height: 12px;
+            border-radius: 6px;
+            margin: 0;
+        }}
+        QScrollBar::handle:horizontal {{
+            background-color: {c.scroll_handle_bg};
+            border-radius: 6px;
+            min-width: 20px;
+            margin: 2px;
+        }}
+        QScrollBar::handle:horizontal:hover {{
+            background-color: {c.scroll_handle_hover_bg};
+        }}
+        QScrollBar::handle:horizontal:pressed {{
+            background-color: {c.scroll_handle_pressed_bg};
+        }}
+        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+            border: none;
+            background: none;
+            width: 0px;
+        }}
+        QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
+            background: none;
+        }}
+        QRadioButton {{
+            spacing: 8px;
+        }}
+        QRadioButton::indicator {{
+            width: 16px;
+            height: 16px;
+            border-radius: 8px;
+            border: 1px solid {c.radio_border};
+            background-color: {c.radio_bg};
+        }}
+        QRadioButton::indicator:checked {{
+            background-color: {c.radio_checked_bg};
+            border-color: {c.radio_checked_border};
+        }}
+        QRadioButton::indicator:hover {{
+            border-color: {c.radio_hover_border};
+        }}
+        """
+
+_THEME_QSS = {name: _QSS_TEMPLATE.format(c=colors) for name, colors in _THEMES.items()}
+
+def _get_theme_qss(theme: str) -> str:
+    return _THEME_QSS.get(theme, _THEME_QSS["dark"])
+
+def _trunc(text: str, limit: int = 100) -> str:
+    return text if len(text) <= limit else text[:limit] + "..."
+
+_LIST_SEPARATOR_RE = re.compile(r'\s*,\s*')
+
+@lru_cache(maxsize=8)
+def _parse_words(text: str) -> Tuple[str, ...]:
+    return tuple(word for word in _LIST_SEPARATOR_RE.split(text.strip()) if word)
+
+@lru_cache(maxsize=8)
+def _parse_extensions(text: str) -> Tuple[str, ...]:
+    return tuple(ext if ext.startswith('.') else f'.{ext}' for ext in _parse_words(text))
+
 class BaseWorker(QObject):
     status_updated = pyqtSignal(str)
-    log_message = pyqtSignal(str)
+    log_batch = pyqtSignal(list)
     progress_updated = pyqtSignal(int, int)
     finished = pyqtSignal(bool)
+    _LOG_BATCH_SIZE = 50
+    _LOG_FLUSH_INTERVAL = 0.1
+    _PROGRESS_INTERVAL = 1 / 30
 
     def __init__(self):
         super().__init__()
         self._stop_requested = False
+        self._log_buffer = []
+        self._last_log_flush = 0.0
+        self._last_progress = 0.0
 
     def stop_processing(self):
         self._stop_requested = True
 
+    def _log(self, message: str):
+        self._log_buffer.append(message)
+        if len(self._log_buffer) >= self._LOG_BATCH_SIZE or time.monotonic() - self._last_log_flush >= self._LOG_FLUSH_INTERVAL:
+            self._flush_logs()
+
+    def _flush_logs(self):
+        if self._log_buffer:
+            self.log_batch.emit(self._log_buffer)
+            self._log_buffer = []
+        self._last_log_flush = time.monotonic()
+
+    def _flush_logs_if_due(self):
+        if self._log_buffer and time.monotonic() - self._last_log_flush >= self._LOG_FLUSH_INTERVAL:
+            self._flush_logs()
+
+    def _report_progress(self, current: int, total: int, status_key: str, /, **status_args):
+        now = time.monotonic()
+        if current < total and now - self._last_progress < self._PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        self.progress_updated.emit(current, total)
+        self.status_updated.emit(self.tr(status_key).format(**status_args))
+        self._flush_logs_if_due()
+
+    def _finish(self, success: bool):
+        self._flush_logs()
+        self.finished.emit(success)
+
 class FileProcessorWorker(BaseWorker):
     preview_ready = pyqtSignal(list)
+    _MMAP_THRESHOLD = 1 << 20
+    _UNICODE_FOLD_BYTES = {
+        'i': b'i|\xc4\xb0|\xc4\xb1',
+        'k': b'k|\xe2\x84\xaa',
+        's': b's|\xc5\xbf'
+    }
+    _BINARY_EXTS = frozenset({
+        '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif', '.webp', '.ico', '.svg',
+        '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v',
+        '.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a',
+        '.zip', '.rar', '.7z', '.tar', '.gz', '.bz2',
+        '.exe', '.dll', '.so', '.dylib', '.bin',
+        '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+        '.db', '.sqlite', '.dat', '.cache'
+    })
 
     def __init__(self):
         super().__init__()
         self.folder_path = ""
+        self._folder_norm = ""
         self.find_text = ""
+        self._find_re = None
+        self._find_bytes_re = None
         self.replace_text = ""
         self.case_sensitive = False
         self.whole_words = False
         self.include_subfolders = False
         self.ignored_words = []
+        self._ignored_words_re = None
         self.ignored_paths = []
+        self._ignored_paths_exact = frozenset()
+        self._ignored_paths_prefixes = ()
         self.ignored_extensions = []
         self.is_preview_mode = False
         self.mode = 'replace'
@@ -176,18 +783,26 @@ class FileProcessorWorker(BaseWorker):
                         ignored_extensions: List[str], ignored_paths: List[str],
                         ignored_words: List[str], is_preview: bool = False, mode: str = 'replace', lang: str = "ru"):
         self.folder_path = folder_path
+        self._folder_norm = os.path.normpath(folder_path)
         self.find_text = find_text
         self.replace_text = replace_text
         self.case_sensitive = case_sensitive
         self.whole_words = whole_words
+        self._find_re = self._compile_find_pattern() if find_text else None
+        self._find_bytes_re = self._compile_bytes_prefilter()
         self.include_subfolders = include_subfolders
         self.ignored_words = [word.strip().lower() for word in ignored_words]
+        self._ignored_words_re = re.compile('|'.join(map(re.escape, self.ignored_words)), re.IGNORECASE) if self.ignored_words else None
         self.ignored_paths = [os.path.normpath(path) for path in ignored_paths]
+        self._ignored_paths_exact = frozenset(self.ignored_paths)
+        self._ignored_paths_prefixes = tuple(path + os.sep for path in self.ignored_paths)
         self.ignored_extensions = [ext.lower().strip() for ext in ignored_extensions]
         self.is_preview_mode = is_preview
         self.mode = mode
         self.lang = lang
+        self._stop_requested = False
 
+    @pyqtSlot()
     def run(self):
         try:
             if self.is_preview_mode:
@@ -200,32 +815,34 @@ class FileProcessorWorker(BaseWorker):
                 elif self.mode == 'copy2':
                     self._run_copy2()
         except Exception as e:
-            self.log_message.emit(self.tr('critical_error').format(error=str(e)))
-            self.finished.emit(False)
+            self._log(self.tr('critical_error').format(error=str(e)))
+            self._finish(False)
 
     def _run_preview(self):
         self.status_updated.emit(self.tr('scanning_folder_preview'))
         try:
             self.temp_matches = []
-            all_items = self._get_all_items()
-            total = len(all_items)
+            all_entries = self._get_all_entries()
+            total = len(all_entries)
             if self.mode == 'copy2':
                 self.status_updated.emit(self.tr('simulating_copy2'))
                 self._simulate_process_dir(self.folder_path)
             else:
-                for i, item_path in enumerate(all_items):
+                for i, entry in enumerate(all_entries):
                     if self._stop_requested:
                         break
-                    self.progress_updated.emit(i + 1, total)
-                    self.status_updated.emit(self.tr('checking_item').format(i=i + 1, total=total))
+                    self._report_progress(i + 1, total, 'checking_item', i=i + 1, total=total)
+                    item_path, item_name = entry.path, entry.name
                     if self._should_ignore_path(item_path):
                         continue
-                    item_name = os.path.basename(item_path)
                     if self._contains_ignored_word(item_name):
                         continue
-                    is_file = os.path.isfile(item_path)
-                    if is_file and self._should_completely_ignore_file(item_path):
-                        continue
+                    is_file = entry.is_file()
+                    is_binary = False
+                    if is_file:
+                        is_binary, is_completely_ignored = self._classify_file(item_name)
+                        if is_completely_ignored:
+                            continue
                     if self.mode == 'replace':
                         if self._text_matches(item_name):
                             new_name = self._replace_text_in_string(item_name)
@@ -236,7 +853,7 @@ class FileProcessorWorker(BaseWorker):
                                 'new_name': new_name,
                                 'is_file': is_file
                             })
-                        if is_file and not self._should_ignore_file(item_path):
+                        if is_file and not is_binary:
                             content_matches = self._check_file_content(item_path)
                             if content_matches:
                                 self.temp_matches.append({
@@ -246,23 +863,23 @@ class FileProcessorWorker(BaseWorker):
                                     'is_file': True
                                 })
                     elif self.mode == 'copy1':
-                        if Path(item_path).parent == Path(self.folder_path):
+                        if os.path.dirname(item_path) == self._folder_norm:
                             if self._text_matches(item_name):
                                 self._simulate_copy_with_replace(item_path, self.folder_path)
-                for item_path in all_items:
+                for entry in all_entries:
                     if self._stop_requested:
                         break
-                    if Path(item_path).parent != Path(self.folder_path):
+                    item_path, item_name = entry.path, entry.name
+                    if os.path.dirname(item_path) != self._folder_norm:
                         continue
-                    if not os.path.isfile(item_path):
+                    if not entry.is_file():
                         continue
-                    item_name = os.path.basename(item_path)
                     if self._text_matches(item_name):
                         continue
-                    if self._should_ignore_path(item_path) or self._contains_ignored_word(item_name) or self._should_ignore_file(item_path) or self._should_completely_ignore_file(item_path):
+                    if self._should_ignore_path(item_path) or self._contains_ignored_word(item_name) or self._should_skip_file(item_name):
                         continue
                     content = self._read_file(item_path)
-                    if content is None or self._contains_ignored_word(content) or not self._text_matches(content):
+                    if content is None or self._contains_ignored_word(content) or not self._content_has_pattern(content):
                         continue
                     new_name = self._get_unique_name(item_name, self.folder_path)
                     target = os.path.join(self.folder_path, new_name)
@@ -283,10 +900,10 @@ class FileProcessorWorker(BaseWorker):
                         })
             self.preview_ready.emit(self.temp_matches)
             self.status_updated.emit(self.tr('preview_completed'))
-            self.finished.emit(True)
+            self._finish(True)
         except Exception as e:
-            self.log_message.emit(self.tr('preview_error').format(error=str(e)))
-            self.finished.emit(False)
+            self._log(self.tr('preview_error').format(error=str(e)))
+            self._finish(False)
 
     def _get_unique_name(self, original_name: str, target_dir: str) -> str:
         base_name, ext = os.path.splitext(original_name)
@@ -306,7 +923,7 @@ class FileProcessorWorker(BaseWorker):
         if self._contains_ignored_word(source_name):
             return
         is_file = os.path.isfile(source)
-        if is_file and (self._should_ignore_file(source) or self._should_completely_ignore_file(source)):
+        if is_file and self._should_skip_file(source_name):
             return
         content = self._read_file(source) if is_file else None
         if is_file and (content is None or self._contains_ignored_word(content)):
@@ -329,7 +946,7 @@ class FileProcessorWorker(BaseWorker):
                 'details': self.tr('copied_no_rename'),
                 'is_file': is_file
             })
-        if is_file and content and self._text_matches(content):
+        if is_file and content and self._content_has_pattern(content):
             matches = self._check_file_content(source)
             if matches:
                 self.temp_matches.append({
@@ -348,18 +965,32 @@ class FileProcessorWorker(BaseWorker):
             return
         if source_path is None:
             source_path = path
-        items = sorted(os.listdir(source_path))
-        for item in items:
-            source_item_path = os.path.join(source_path, item)
-            if self._should_ignore_path(source_item_path) or self._contains_ignored_word(source_item_path) or self._contains_ignored_word(item):
-                continue
-            if not self._text_matches(item):
+        with os.scandir(source_path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        target_prefix = path if path.endswith(os.sep) else path + os.sep
+        to_rename = []
+        to_content_copy = []
+        to_recurse = []
+        to_recurse_renamed = []
+        for entry in entries:
+            is_file = entry.is_file()
+            name_matches = self._text_matches(entry.name)
+            if entry.is_dir():
+                to_recurse.append(entry)
+                if name_matches:
+                    to_recurse_renamed.append(entry)
+            if self._should_ignore_path(entry.path) or self._contains_ignored_word(entry.path):
                 continue
+            if name_matches:
+                to_rename.append((entry, is_file))
+            elif is_file:
+                to_content_copy.append(entry)
+        for entry, is_file in to_rename:
+            item, source_item_path = entry.name, entry.path
             new_name = self._replace_text_in_string(item)
-            new_path = os.path.join(path, new_name)
-            is_file = os.path.isfile(source_item_path)
+            new_path = target_prefix + new_name
             if is_file:
-                if self._should_ignore_file(source_item_path) or self._should_completely_ignore_file(source_item_path):
+                if self._should_skip_file(item):
                     continue
                 content = self._read_file(source_item_path)
                 if content is None or self._contains_ignored_word(content):
@@ -380,77 +1011,65 @@ class FileProcessorWorker(BaseWorker):
                         'matches': content_matches,
                         'is_file': True
                     })
-        for item in items:
-            source_item_path = os.path.join(source_path, item)
-            if os.path.isfile(source_item_path) and not self._text_matches(item):
-                if self._should_ignore_path(source_item_path) or self._contains_ignored_word(source_item_path) or self._contains_ignored_word(item):
-                    continue
-                if self._should_ignore_file(source_item_path) or self._should_completely_ignore_file(source_item_path):
-                    continue
-                content = self._read_file(source_item_path)
-                if content is None or self._contains_ignored_word(content) or not self._text_matches(content):
-                    continue
-                new_name = self._get_unique_name(item, path)
-                new_path = os.path.join(path, new_name)
+        for entry in to_content_copy:
+            item, source_item_path = entry.name, entry.path
+            if self._should_skip_file(item):
+                continue
+            content = self._read_file(source_item_path)
+            if content is None or self._contains_ignored_word(content) or not self._content_has_pattern(content):
+                continue
+            new_name = self._get_unique_name(item, path)
+            new_path = target_prefix + new_name
+            self.temp_matches.append({
+                'path': new_path,
+                'type': 'created_content',
+                'old_name': item,
+                'new_name': new_name,
+                'is_file': True
+            })
+            content_matches = self._check_file_content(source_item_path)
+            if content_matches:
                 self.temp_matches.append({
                     'path': new_path,
-                    'type': 'created_content',
-                    'old_name': item,
-                    'new_name': new_name,
+                    'type': 'content',
+                    'matches': content_matches,
                     'is_file': True
                 })
-                content_matches = self._check_file_content(source_item_path)
-                if content_matches:
-                    self.temp_matches.append({
-                        'path': new_path,
-                        'type': 'content',
-                        'matches': content_matches,
-                        'is_file': True
-                    })
-        for item in items:
-            source_item_path = os.path.join(source_path, item)
-            if os.path.isdir(source_item_path):
-                item_path = os.path.join(path, item)
-                self._simulate_process_dir(item_path, source_item_path)
-        for item in items:
-            source_item_path = os.path.join(source_path, item)
-            if self._text_matches(item) and os.path.isdir(source_item_path):
-                new_name = self._replace_text_in_string(item)
-                new_path = os.path.join(path, new_name)
-                self._simulate_process_dir(new_path, source_item_path)
+        for entry in to_recurse:
+            self._simulate_process_dir(target_prefix + entry.name, entry.path)
+        for entry in to_recurse_renamed:
+            new_name = self._replace_text_in_string(entry.name)
+            self._simulate_process_dir(target_prefix + new_name, entry.path)
 
     def _run_replacement(self):
         self.status_updated.emit(self.tr('starting_replacement'))
         try:
-            all_items = self._get_all_items()
+            all_entries = self._get_all_entries()
             replaced_count = 0
-            filtered_items = [item_path for item_path in all_items if not self._contains_ignored_word(item_path)]
-            files = [item for item in filtered_items if os.path.isfile(item)]
-            for i, file_path in enumerate(files):
+            filtered_entries = [entry for entry in all_entries if not self._contains_ignored_word(entry.path)]
+            files = [entry for entry in filtered_entries if entry.is_file()]
+            for i, entry in enumerate(files):
                 if self._stop_requested:
                     break
-                self.progress_updated.emit(i + 1, len(filtered_items))
-                self.status_updated.emit(self.tr('processing_file').format(i=i + 1, total=len(files)))
-                if self._contains_ignored_word(os.path.basename(file_path)):
+                self._report_progress(i + 1, len(filtered_entries), 'processing_file', i=i + 1, total=len(files))
+                if self._contains_ignored_word(entry.name) or self._should_skip_file(entry.name):
                     continue
-                if self._process_file_content(file_path):
+                if self._process_file_content(entry.path):
                     replaced_count += 1
-            filtered_items_reversed = list(reversed(filtered_items))
-            for i, item_path in enumerate(filtered_items_reversed):
+            for i, entry in enumerate(reversed(filtered_entries)):
                 if self._stop_requested:
                     break
-                self.progress_updated.emit(len(files) + i + 1, len(filtered_items) + len(files))
-                self.status_updated.emit(self.tr('renaming_item').format(i=i + 1, total=len(filtered_items)))
-                if self._contains_ignored_word(os.path.basename(item_path)):
+                self._report_progress(len(files) + i + 1, len(filtered_entries) + len(files), 'renaming_item', i=i + 1, total=len(filtered_entries))
+                if self._contains_ignored_word(entry.name):
                     continue
-                if self._process_item_name(item_path):
+                if self._process_item_name(entry.path):
                     replaced_count += 1
-            self.log_message.emit(self.tr('replacement_completed').format(count=replaced_count))
+            self._log(self.tr('replacement_completed').format(count=replaced_count))
             self.status_updated.emit(self.tr('replacement_completed').format(count=replaced_count))
-            self.finished.emit(True)
+            self._finish(True)
         except Exception as e:
-            self.log_message.emit(self.tr('replacement_error').format(error=str(e)))
-            self.finished.emit(False)
+            self._log(self.tr('replacement_error').format(error=str(e)))
+            self._finish(False)
 
     def _run_copy1(self):
         self.status_updated.emit(self.tr('starting_copy1'))
@@ -461,8 +1080,7 @@ class FileProcessorWorker(BaseWorker):
             for i, item_path in enumerate(filtered_items):
                 if self._stop_requested:
                     break
-                self.progress_updated.emit(i + 1, len(filtered_items))
-                self.status_updated.emit(self.tr('processing_item').format(i=i + 1, total=len(filtered_items)))
+                self._report_progress(i + 1, len(filtered_items), 'processing_item', i=i + 1, total=len(filtered_items))
                 item_name = os.path.basename(item_path)
                 if not self._text_matches(item_name):
                     continue
@@ -475,23 +1093,23 @@ class FileProcessorWorker(BaseWorker):
                 item_name = os.path.basename(file_path)
                 if self._text_matches(item_name):
                     continue
-                if self._contains_ignored_word(item_name) or self._should_ignore_path(file_path) or self._should_ignore_file(file_path) or self._should_completely_ignore_file(file_path):
+                if self._contains_ignored_word(item_name) or self._should_ignore_path(file_path) or self._should_skip_file(item_name):
                     continue
                 content = self._read_file(file_path)
-                if content is None or self._contains_ignored_word(content) or not self._text_matches(content):
+                if content is None or self._contains_ignored_word(content) or not self._content_has_pattern(content):
                     continue
                 new_name = self._get_unique_name(item_name, self.folder_path)
                 target = os.path.join(self.folder_path, new_name)
                 shutil.copy2(file_path, target)
                 if self._process_file_content(target):
-                    self.log_message.emit(self.tr('file_copied_content').format(target=target, source=file_path))
+                    self._log(self.tr('file_copied_content').format(target=target, source=file_path))
                     created_count += 1
-            self.log_message.emit(self.tr('copy1_completed').format(count=created_count))
+            self._log(self.tr('copy1_completed').format(count=created_count))
             self.status_updated.emit("Завершено")
-            self.finished.emit(True)
+            self._finish(True)
         except Exception as e:
-            self.log_message.emit(self.tr('copy1_error').format(error=str(e)))
-            self.finished.emit(False)
+            self._log(self.tr('copy1_error').format(error=str(e)))
+            self._finish(False)
 
     def _process_copy_with_replace(self, source: str, target_parent: str) -> bool:
         try:
@@ -505,14 +1123,14 @@ class FileProcessorWorker(BaseWorker):
             target = os.path.join(target_parent, new_name)
             if os.path.exists(target):
                 if renamed:
-                    self.log_message.emit(self.tr('rename_impossible').format(target=target))
+                    self._log(self.tr('rename_impossible').format(target=target))
                     return False
                 else:
                     new_name = self._get_unique_name(source_name, target_parent)
                     target = os.path.join(target_parent, new_name)
             is_file = os.path.isfile(source)
             if is_file:
-                if self._should_ignore_file(source) or self._should_completely_ignore_file(source):
+                if self._should_skip_file(source_name):
                     return False
                 content = self._read_file(source)
                 if content is None or self._contains_ignored_word(content):
@@ -524,7 +1142,7 @@ class FileProcessorWorker(BaseWorker):
                     msg += self.tr('renamed_from').format(name=source_name)
                 if replaced:
                     msg += self.tr('content_changed')
-                self.log_message.emit(msg)
+                self._log(msg)
             else:
                 os.mkdir(target)
                 for child in os.listdir(source):
@@ -533,42 +1151,54 @@ class FileProcessorWorker(BaseWorker):
                 msg = self.tr('folder_copied').format(target=target)
                 if renamed:
                     msg += self.tr('folder_renamed_from').format(name=source_name)
-                self.log_message.emit(msg)
+                self._log(msg)
             return True
         except Exception as e:
-            self.log_message.emit(self.tr('copy_error').format(source=source, error=str(e)))
+            self._log(self.tr('copy_error').format(source=source, error=str(e)))
             return False
 
     def _run_copy2(self):
         self.status_updated.emit(self.tr('starting_copy2'))
         try:
             self._process_dir(self.folder_path)
-            self.log_message.emit(self.tr('copy2_completed'))
+            self._log(self.tr('copy2_completed'))
             self.status_updated.emit("Завершено")
-            self.finished.emit(True)
+            self._finish(True)
         except Exception as e:
-            self.log_message.emit(self.tr('copy2_error').format(error=str(e)))
-            self.finished.emit(False)
+            self._log(self.tr('copy2_error').format(error=str(e)))
+            self._finish(False)
 
     def _process_dir(self, path: str):
         if self._stop_requested:
             return
-        items = sorted(os.listdir(path))
-        created_dirs = []
-        for item in items:
-            item_path = os.path.join(path, item)
-            if self._should_ignore_path(item_path) or self._contains_ignored_word(item_path) or self._contains_ignored_word(item):
-                continue
-            if not self._text_matches(item):
+        self._flush_logs_if_due()
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        target_prefix = path if path.endswith(os.sep) else path + os.sep
+        to_rename = []
+        to_content_copy = []
+        to_recurse = []
+        for entry in entries:
+            is_file = entry.is_file()
+            if entry.is_dir():
+                to_recurse.append(entry.path)
+            if self._should_ignore_path(entry.path) or self._contains_ignored_word(entry.path):
                 continue
+            if self._text_matches(entry.name):
+                to_rename.append((entry, is_file))
+            elif is_file:
+                to_content_copy.append(entry)
+        created_dirs = []
+        for entry, is_file in to_rename:
+            self._flush_logs_if_due()
+            item, item_path = entry.name, entry.path
             new_name = self._replace_text_in_string(item)
-            new_path = os.path.join(path, new_name)
+            new_path = target_prefix + new_name
             if os.path.exists(new_path):
-                self.log_message.emit(self.tr('already_exists').format(path=new_path))
+                self._log(self.tr('already_exists').format(path=new_path))
                 continue
-            is_file = os.path.isfile(item_path)
             if is_file:
-                if self._should_ignore_file(item_path) or self._should_completely_ignore_file(item_path):
+                if self._should_skip_file(item):
                     continue
                 content = self._read_file(item_path)
                 if content is None or self._contains_ignored_word(content):
@@ -578,51 +1208,74 @@ class FileProcessorWorker(BaseWorker):
                 msg = self.tr('file_copied_renamed').format(path=new_path, name=item)
                 if count > 0:
                     msg += self.tr('replacements_made').format(count=count)
-                self.log_message.emit(msg)
+                self._log(msg)
             else:
-                os.mkdir(new_path)
-                shutil.copytree(item_path, new_path, dirs_exist_ok=True)
-                self.log_message.emit(self.tr('folder_copied_renamed').format(path=new_path, name=item))
+                shutil.copytree(item_path, new_path)
+                self._log(self.tr('folder_copied_renamed').format(path=new_path, name=item))
                 created_dirs.append(new_path)
-        for item in items:
-            item_path = os.path.join(path, item)
-            if os.path.isfile(item_path) and not self._text_matches(item):
-                if self._should_ignore_path(item_path) or self._contains_ignored_word(item_path) or self._contains_ignored_word(item):
-                    continue
-                if self._should_ignore_file(item_path) or self._should_completely_ignore_file(item_path):
-                    continue
-                content = self._read_file(item_path)
-                if content is None or self._contains_ignored_word(content) or not self._text_matches(content):
-                    continue
-                new_name = self._get_unique_name(item, path)
-                new_path = os.path.join(path, new_name)
-                shutil.copy2(item_path, new_path)
-                count = self._process_file_content(new_path) or 0
-                msg = self.tr('file_copied_content_replace').format(path=new_path, name=item)
-                if count > 0:
-                    msg += self.tr('replacements_made').format(count=count)
-                self.log_message.emit(msg)
-        for item in items:
-            item_path = os.path.join(path, item)
-            if os.path.isdir(item_path):
-                self._process_dir(item_path)
+        for entry in to_content_copy:
+            self._flush_logs_if_due()
+            item, item_path = entry.name, entry.path
+            if self._should_skip_file(item):
+                continue
+            content = self._read_file(item_path)
+            if content is None or self._contains_ignored_word(content) or not self._content_has_pattern(content):
+                continue
+            new_name = self._get_unique_name(item, path)
+            new_path = target_prefix + new_name
+            shutil.copy2(item_path, new_path)
+            count = self._process_file_content(new_path) or 0
+            msg = self.tr('file_copied_content_replace').format(path=new_path, name=item)
+            if count > 0:
+                msg += self.tr('replacements_made').format(count=count)
+            self._log(msg)
+        for item_path in to_recurse:
+            self._process_dir(item_path)
         for new_path in created_dirs:
             self._process_dir(new_path)
 
-    def _get_all_items(self) -> List[str]:
-        items = []
-        folder_path = Path(self.folder_path)
+    def _get_all_entries(self) -> List[os.DirEntry]:
+        entries = []
         try:
-            for item in folder_path.iterdir():
-                items.append(str(item))
-            if self.include_subfolders:
-                for subfolder in folder_path.iterdir():
-                    if subfolder.is_dir():
-                        for item in subfolder.rglob('*'):
-                            items.append(str(item))
+            with os.scandir(self._folder_norm) as it:
+                top_entries = list(it)
         except PermissionError:
-            self.log_message.emit(self.tr('no_access_folder').format(path=self.folder_path))
-        return items
+            self._log(self.tr('no_access_folder').format(path=self.folder_path))
+            return entries
+        entries.extend(top_entries)
+        if self.include_subfolders:
+            for entry in top_entries:
+                if entry.is_dir():
+                    self._collect_entries(entry.path, entries)
+        return entries
+
+    def _collect_entries(self, dir_path: str, entries: List[os.DirEntry]):
+        try:
+            with os.scandir(dir_path) as it:
+                dir_entries = list(it)
+        except PermissionError:
+            return
+        entries.extend(dir_entries)
+        for entry in dir_entries:
+            if entry.is_dir() and not entry.is_symlink():
+                self._collect_entries(entry.path, entries)
+
+    def _compile_find_pattern(self):
+        pattern = re.escape(self.find_text)
+        if self.whole_words:
+            pattern = r'\b' + pattern + r'\b'
+        return re.compile(pattern, 0 if self.case_sensitive else re.IGNORECASE)
+
+    def _compile_bytes_prefilter(self):
+        if not self.find_text or not self.find_text.isascii():
+            return None
+        if self.case_sensitive:
+            return re.compile(re.escape(self.find_text.encode('ascii')))
+        parts = []
+        for char in self.find_text:
+            folded = self._UNICODE_FOLD_BYTES.get(char.lower())
+            parts.append(b'(?:' + folded + b')' if folded else re.escape(char.encode('ascii')))
+        return re.compile(b''.join(parts), re.IGNORECASE)
 
     def _text_matches(self, text: str) -> bool:
         if not self.find_text:
@@ -636,6 +1289,13 @@ class FileProcessorWorker(BaseWorker):
         else:
             return search_text in target_text
 
+    def _content_has_pattern(self, content: str) -> bool:
+        if self._find_re is None:
+            return False
+        if self.case_sensitive and not self.whole_words:
+            return self.find_text in content
+        return self._find_re.search(content) is not None
+
     def _replace_text_in_string(self, text: str) -> str:
         if not self.find_text:
             return text
@@ -650,118 +1310,274 @@ class FileProcessorWorker(BaseWorker):
                 pattern = re.escape(self.find_text)
                 return re.sub(pattern, self.replace_text, text, flags=re.IGNORECASE)
 
+    def _replace_text_with_count(self, text: str) -> Tuple[str, int]:
+        if self._find_re is None:
+            return text, 0
+        if self.case_sensitive and not self.whole_words:
+            return text.replace(self.find_text, self.replace_text), text.count(self.find_text)
+        return self._find_re.subn(self.replace_text, text)
+
     def _contains_ignored_word(self, text: str) -> bool:
-        if not self.ignored_words:
+        if self._ignored_words_re is None:
             return False
-        text_lower = text.lower()
-        return any(word in text_lower for word in self.ignored_words)
-
-    def _should_ignore_file(self, file_path: str) -> bool:
-        binary_extensions = {
-            '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif', '.webp', '.ico', '.svg',
-            '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v',
-            '.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a',
-            '.zip', '.rar', '.7z', '.tar', '.gz', '.bz2',
-            '.exe', '.dll', '.so', '.dylib', '.bin',
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-            '.db', '.sqlite', '.dat', '.cache'
-        }
-        file_ext = os.path.splitext(file_path)[1].lower()
-        return file_ext in binary_extensions
+        return self._ignored_words_re.search(text) is not None
 
-    def _should_completely_ignore_file(self, file_path: str) -> bool:
-        if not self.ignored_extensions:
-            return False
-        file_ext = os.path.splitext(file_path)[1].lower()
-        return file_ext in self.ignored_extensions
+    def _classify_file(self, file_name: str) -> Tuple[bool, bool]:
+        file_ext = os.path.splitext(file_name)[1].lower()
+        return file_ext in self._BINARY_EXTS, file_ext in self.ignored_extensions
+
+    def _should_skip_file(self, file_name: str) -> bool:
+        is_binary, is_completely_ignored = self._classify_file(file_name)
+        return is_binary or is_completely_ignored
 
     def _should_ignore_path(self, item_path: str) -> bool:
         if not self.ignored_paths:
             return False
         item_path_norm = os.path.normpath(item_path)
-        return any(item_path_norm.startswith(ignored_path + os.sep) or item_path_norm == ignored_path
-                   for ignored_path in self.ignored_paths)
+        return item_path_norm in self._ignored_paths_exact or item_path_norm.startswith(self._ignored_paths_prefixes)
+
+    def _read_file(self, file_path: str) -> Optional[str]:
+        return self._read_file_with_encoding(file_path)[0]
 
-    def _read_file(self, file_path: str) -> str:
+    def _read_file_with_encoding(self, file_path: str) -> Tuple[Optional[str], Optional[str]]:
+        data = Path(file_path).read_bytes()
         encodings = ['utf-8', 'cp1251', 'latin-1']
+        if data.startswith(b'\xef\xbb\xbf'):
+            encodings.insert(0, 'utf-8-sig')
         for encoding in encodings:
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    return f.read()
+                return data.decode(encoding), encoding
             except UnicodeDecodeError:
                 continue
-        return None
+        return None, None
+
+    def _large_file_may_match(self, file_path: str) -> bool:
+        if self._find_bytes_re is None or os.path.getsize(file_path) <= self._MMAP_THRESHOLD:
+            return True
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return self._find_bytes_re.search(mm) is not None
 
     def _check_file_content(self, file_path: str) -> List[Dict]:
-        if self._should_ignore_path(file_path) or self._should_completely_ignore_file(file_path) or self._should_ignore_file(file_path):
+        if self._find_re is None:
+            return []
+        if self._should_ignore_path(file_path):
+            return []
+        if not self._large_file_may_match(file_path):
             return []
         content = self._read_file(file_path)
         if content is None or self._contains_ignored_word(content):
             return []
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         matches = []
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            if self._text_matches(line):
-                matches.append({
-                    'line_number': line_num,
-                    'line_content': line.strip(),
-                    'replaced_line': self._replace_text_in_string(line).strip()
-                })
+        line_number = 1
+        counted_to = 0
+        line_end = -1
+        for match in self._find_re.finditer(content):
+            match_start = match.start()
+            if match_start <= line_end:
+                continue
+            line_number += content.count('\n', counted_to, match_start)
+            counted_to = match_start
+            line_start = content.rfind('\n', 0, match_start) + 1
+            line_end = content.find('\n', match_start)
+            if line_end == -1:
+                line_end = len(content)
+            line = content[line_start:line_end]
+            matches.append({
+                'line_number': line_number,
+                'line_content': line.strip(),
+                'replaced_line': self._replace_text_in_string(line).strip()
+            })
         return matches
 
     def _process_file_content(self, file_path: str) -> bool:
-        if self._should_ignore_path(file_path) or self._should_completely_ignore_file(file_path) or self._should_ignore_file(file_path):
+        if self._should_ignore_path(file_path):
             return False
-        content = self._read_file(file_path)
-        used_encoding = 'utf-8'
-        if content is None:
-            encodings = ['utf-8', 'cp1251', 'latin-1']
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        content = f.read()
-                        used_encoding = encoding
-                        break
-                except UnicodeDecodeError:
-                    continue
-        if content is None or self._contains_ignored_word(content) or not self._text_matches(content):
+        if not self._large_file_may_match(file_path):
+            return False
+        content, used_encoding = self._read_file_with_encoding(file_path)
+        if content is None or self._contains_ignored_word(content) or not self._content_has_pattern(content):
             return False
-        new_content = self._replace_text_in_string(content)
-        flags = re.IGNORECASE if not self.case_sensitive else 0
-        pattern = r'\b' + re.escape(self.find_text) + r'\b' if self.whole_words else re.escape(self.find_text)
-        old_count = len(re.findall(pattern, content, flags))
-        with open(file_path, 'w', encoding=used_encoding) as f:
-            f.write(new_content)
-        self.log_message.emit(self.tr('file_replacements').format(path=file_path, count=old_count))
+        new_content, old_count = self._replace_text_with_count(content)
+        try:
+            data = new_content.encode(used_encoding)
+        except UnicodeEncodeError:
+            data = new_content.encode('utf-8')
+        Path(file_path).write_bytes(data)
+        self._log(self.tr('file_replacements').format(path=file_path, count=old_count))
         return True
 
     def _process_item_name(self, item_path: str) -> bool:
         try:
-            if self._should_ignore_path(item_path) or (os.path.isfile(item_path) and self._should_completely_ignore_file(item_path)):
+            if self._should_ignore_path(item_path):
                 return False
-            if os.path.isfile(item_path) and not self._should_ignore_file(item_path):
-                try:
-                    content = self._read_file(item_path)
-                    if content is not None and self._contains_ignored_word(content):
-                        return False
-                except Exception:
-                    pass
             item_name = os.path.basename(item_path)
+            if os.path.isfile(item_path):
+                is_binary, is_completely_ignored = self._classify_file(item_name)
+                if is_completely_ignored:
+                    return False
+                if not is_binary:
+                    try:
+                        content = self._read_file(item_path)
+                        if content is not None and self._contains_ignored_word(content):
+                            return False
+                    except Exception:
+                        pass
             if not self._text_matches(item_name):
                 return False
             new_name = self._replace_text_in_string(item_name)
             new_path = os.path.join(os.path.dirname(item_path), new_name)
             if os.path.exists(new_path):
-                self.log_message.emit(self.tr('rename_impossible_exists').format(path=new_path))
+                self._log(self.tr('rename_impossible_exists').format(path=new_path))
                 return False
             os.rename(item_path, new_path)
             item_type = self.tr("folder_type") if os.path.isdir(new_path) else self.tr("file_type")
-            self.log_message.emit(self.tr('item_renamed').format(type=item_type, old=item_name, new=new_name))
+            self._log(self.tr('item_renamed').format(type=item_type, old=item_name, new=new_name))
             return True
         except Exception as e:
-            self.log_message.emit(self.tr('rename_error').format(path=item_path, error=str(e)))
+            self._log(self.tr('rename_error').format(path=item_path, error=str(e)))
             return False
 
+class PreviewModel(QAbstractItemModel):
+    _LABEL_KEYS = ('folder_type', 'file_type', 'line', 'found_in_content', 'name_change',
+                   'content_change', 'created_rename', 'created', 'created_content')
+
+    def __init__(self, path_groups: Iterable[Tuple[str, Iterable[Dict]]], folder_path: str, lang: str, parent=None):
+        super().__init__(parent)
+        self.lang = lang
+        self._labels = {key: self.tr(key) for key in self._LABEL_KEYS}
+        self._nodes = [None]
+        self._parents = [-1]
+        self._rows = [0]
+        self._children = [[]]
+        self._unfetched = set()
+        self._build(path_groups, folder_path)
+
+    def tr(self, key):
+        return LANGUAGES[key][self.lang]
+
+    def _add_node(self, parent_id: int, node: tuple) -> int:
+        node_id = len(self._nodes)
+        self._nodes.append(node)
+        self._parents.append(parent_id)
+        self._rows.append(len(self._children[parent_id]))
+        self._children[parent_id].append(node_id)
+        self._children.append([])
+        return node_id
+
+    def _build(self, path_groups: Iterable[Tuple[str, Iterable[Dict]]], folder_path: str):
+        node_index: Dict[Tuple[str, ...], int] = {}
+        base = Path(folder_path)
+        for path, changes in path_groups:
+            changes = list(changes)
+            item_path = Path(path)
+            try:
+                rel_parts = item_path.relative_to(base).parts
+            except ValueError:
+                rel_parts = item_path.parts
+            rel_parts = tuple(map(sys.intern, rel_parts))
+            current = 0
+            for depth in range(1, len(rel_parts)):
+                key = rel_parts[:depth]
+                found = node_index.get(key)
+                if found is None:
+                    found = self._add_node(current, ('folder', rel_parts[depth - 1]))
+                    node_index[key] = found
+                current = found
+            leaf_node = ('item', rel_parts[-1], changes[0].get('is_file', False))
+            leaf = node_index.get(rel_parts)
+            if leaf is None:
+                leaf = self._add_node(current, leaf_node)
+                node_index[rel_parts] = leaf
+            else:
+                self._nodes[leaf] = leaf_node
+            for change in changes:
+                change_id = self._add_node(leaf, ('change', change))
+                if change['type'] == 'content' and change['matches']:
+                    self._unfetched.add(change_id)
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        children = self._children[parent.internalId() if parent.isValid() else 0]
+        if 0 <= row < len(children) and 0 <= column < 3:
+            return self.createIndex(row, column, children[row])
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        parent_id = self._parents[index.internalId()]
+        if parent_id <= 0:
+            return QModelIndex()
+        return self.createIndex(self._rows[parent_id], 0, parent_id)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._children[0])
+        if parent.column() != 0:
+            return 0
+        return len(self._children[parent.internalId()])
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 3
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() and parent.internalId() in self._unfetched:
+            return parent.column() == 0
+        return self.rowCount(parent) > 0
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return parent.isValid() and parent.internalId() in self._unfetched
+
+    def fetchMore(self, parent: QModelIndex):
+        if not self.canFetchMore(parent):
+            return
+        change_id = parent.internalId()
+        self._unfetched.discard(change_id)
+        content_matches = self._nodes[change_id][1]['matches']
+        count = min(len(content_matches), 10)
+        self.beginInsertRows(parent, 0, count - 1)
+        for content_match in islice(content_matches, count):
+            self._add_node(change_id, ('line', content_match))
+        self.endInsertRows()
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.tr('tree_headers')[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._node_text(self._nodes[index.internalId()], index.column())
+
+    def _node_text(self, node: tuple, column: int) -> Optional[str]:
+        labels = self._labels
+        kind = node[0]
+        if kind == 'folder':
+            return (node[1], labels['folder_type'], None)[column]
+        if kind == 'item':
+            return (node[1], labels['file_type'] if node[2] else labels['folder_type'], None)[column]
+        if kind == 'line':
+            content_match = node[1]
+            if column == 0:
+                return f"{labels['line']} {content_match['line_number']}"
+            return _trunc(content_match['line_content'] if column == 1 else content_match['replaced_line'])
+        change = node[1]
+        if column == 1:
+            return None
+        if change['type'] == 'name':
+            return labels['name_change'] if column == 0 else f"{change['old_name']} → {change['new_name']}"
+        elif change['type'] == 'content':
+            return labels['content_change'] if column == 0 else f"{labels['found_in_content']} {len(change['matches'])}"
+        elif change['type'] == 'created_rename':
+            return labels['created_rename'] if column == 0 else f"{change['old_name']} → {change['new_name']}"
+        elif change['type'] == 'created':
+            return labels['created'] if column == 0 else change.get('details')
+        elif change['type'] == 'created_content':
+            return labels['created_content'] if column == 0 else f"{change['old_name']} → {change['new_name']}"
+        return None
+
 class PreviewDialog(QDialog):
     def __init__(self, matches: List[Dict], parent=None):
         super().__init__(parent)
@@ -780,9 +1596,9 @@ class PreviewDialog(QDialog):
         info_label = QLabel(f"{self.tr('found_matches')} {len(self.matches)}")
         info_label.setStyleSheet("font-weight: bold; padding: 5px;")
         layout.addWidget(info_label)
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(self.tr('tree_headers'))
+        self.tree = QTreeView()
         self.tree.setAlternatingRowColors(True)
+        self.tree.setUniformRowHeights(True)
         self._populate_tree()
         layout.addWidget(self.tree)
         close_btn = QPushButton(self.tr('close_btn'))
@@ -790,88 +1606,23 @@ class PreviewDialog(QDialog):
         layout.addWidget(close_btn)
 
     def _populate_tree(self):
-        def get_child_count(node):
-            if isinstance(node, QTreeWidgetItem):
-                return node.childCount()
-            else:
-                return node.topLevelItemCount()
-
-        def get_child(node, index):
-            if isinstance(node, QTreeWidgetItem):
-                return node.child(index)
-            else:
-                return node.topLevelItem(index)
-
-        path_to_changes = defaultdict(list)
-        for match in self.matches:
-            path_to_changes[match['path']].append(match)
-        root = self.tree
-        for path in sorted(path_to_changes.keys()):
-            try:
-                rel_parts = Path(path).relative_to(self.parent.folder_path).parts
-            except ValueError:
-                rel_parts = Path(path).parts
-            current = root
-            for part in rel_parts[:-1]:
-                found = None
-                for i in range(get_child_count(current)):
-                    if get_child(current, i).text(0) == part:
-                        found = get_child(current, i)
-                        break
-                if found:
-                    current = found
-                else:
-                    new_item = QTreeWidgetItem(current) if isinstance(current, QTreeWidgetItem) else QTreeWidgetItem(self.tree)
-                    new_item.setText(0, part)
-                    new_item.setText(1, self.tr('folder_type'))
-                    new_item.setText(2, "")
-                    current = new_item
-            leaf_part = rel_parts[-1]
-            leaf = None
-            for i in range(get_child_count(current)):
-                if get_child(current, i).text(0) == leaf_part:
-                    leaf = get_child(current, i)
-                    break
-            if not leaf:
-                leaf = QTreeWidgetItem(current)
-                leaf.setText(0, leaf_part)
-            changes = path_to_changes[path]
-            is_file = changes[0].get('is_file', False)
-            leaf.setText(1, self.tr('file_type') if is_file else self.tr('folder_type'))
-            leaf.setText(2, "")
-            for change in changes:
-                change_item = QTreeWidgetItem(leaf)
-                if change['type'] == 'name':
-                    change_item.setText(0, self.tr('name_change'))
-                    change_item.setText(1, "")
-                    change_item.setText(2, f"{change['old_name']} → {change['new_name']}")
-                elif change['type'] == 'content':
-                    change_item.setText(0, self.tr('content_change'))
-                    change_item.setText(1, "")
-                    change_item.setText(2, f"{self.tr('found_in_content')} {len(change['matches'])}")
-                    for content_match in change['matches'][:10]:
-                        child_item = QTreeWidgetItem(change_item)
-                        child_item.setText(0, f"{self.tr('line')} {content_match['line_number']}")
-                        child_item.setText(1, content_match['line_content'][:100] + ("..." if len(content_match['line_content']) > 100 else ""))
-                        child_item.setText(2, content_match['replaced_line'][:100] + ("..." if len(content_match['replaced_line']) > 100 else ""))
-                elif change['type'] == 'created_rename':
-                    change_item.setText(0, self.tr('created_rename'))
-                    change_item.setText(1, "")
-                    change_item.setText(2, f"{change['old_name']} → {change['new_name']}")
-                elif change['type'] == 'created':
-                    change_item.setText(0, self.tr('created'))
-                    change_item.setText(1, "")
-                    change_item.setText(2, change.get('details', ""))
-                elif change['type'] == 'created_content':
-                    change_item.setText(0, self.tr('created_content'))
-                    change_item.setText(1, "")
-                    change_item.setText(2, f"{change['old_name']} → {change['new_name']}")
-        self.tree.expandAll()
-        self.tree.resizeColumnToContents(0)
-        self.tree.resizeColumnToContents(1)
-        self.tree.resizeColumnToContents(2)
+        self.model = PreviewModel(groupby(sorted(self.matches, key=itemgetter('path')), key=itemgetter('path')), self.parent.folder_path, self.parent.current_language, self)
+        self.tree.setModel(self.model)
+        self.tree.expandToDepth(0)
+        header = self.tree.header()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setStretchLastSection(True)
+        if len(self.matches) <= 1000:
+            self.tree.resizeColumnToContents(0)
+            self.tree.resizeColumnToContents(1)
+            self.tree.resizeColumnToContents(2)
+        else:
+            header.resizeSection(0, 300)
+            header.resizeSection(1, 250)
 
 class LogViewerDialog(QDialog):
+    _font = None
+
     def __init__(self, logs: str, parent=None):
         super().__init__(parent)
         self.logs = logs
@@ -886,10 +1637,14 @@ class LogViewerDialog(QDialog):
         self.setModal(False)
         self.resize(700, 500)
         layout = QVBoxLayout(self)
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(10000)
+        self.log_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.log_text.setPlainText(self.logs)
-        self.log_text.setFont(QFont("Consolas", 9))
+        if LogViewerDialog._font is None:
+            LogViewerDialog._font = QFont("Consolas", 9)
+        self.log_text.setFont(LogViewerDialog._font)
         layout.addWidget(self.log_text)
         button_layout = QHBoxLayout()
         self.clear_btn = QPushButton(self.tr('clear_logs_btn'))
@@ -922,6 +1677,9 @@ class LogViewerDialog(QDialog):
         cursor.movePosition(cursor.MoveOperation.End)
         self.log_text.setTextCursor(cursor)
 
+    def append_lines(self, lines: List[str]):
+        self.log_text.appendPlainText('\n'.join(lines))
+
 class SettingsDialog(QDialog):
     language_changed = pyqtSignal(str)
 
@@ -948,11 +1706,16 @@ class SettingsDialog(QDialog):
         self.theme_button_group.addButton(self.poisonous_purple_theme_radio)
         self.theme_button_group.addButton(self.midnight_gold_theme_radio)
         
-        current_theme = self.settings.value("theme", "dark", type=str)
-        self.light_theme_radio.setChecked(current_theme == "light")
-        self.dark_theme_radio.setChecked(current_theme == "dark")
-        self.poisonous_purple_theme_radio.setChecked(current_theme == "poisonous_purple")
-        self.midnight_gold_theme_radio.setChecked(current_theme == "midnight_gold")
+        theme_radios = {
+            "light": self.light_theme_radio,
+            "dark": self.dark_theme_radio,
+            "poisonous_purple": self.poisonous_purple_theme_radio,
+            "midnight_gold": self.midnight_gold_theme_radio
+        }
+        self._radio_to_theme = {radio: theme for theme, radio in theme_radios.items()}
+        current_radio = theme_radios.get(self.parent().current_theme)
+        if current_radio:
+            current_radio.setChecked(True)
         
         self.light_theme_radio.toggled.connect(self.change_theme)
         self.dark_theme_radio.toggled.connect(self.change_theme)
@@ -972,7 +1735,7 @@ class SettingsDialog(QDialog):
         self.en_radio = QRadioButton(self.parent().tr('en_radio'))
         self.language_button_group.addButton(self.ru_radio)
         self.language_button_group.addButton(self.en_radio)
-        current_lang = self.settings.value("language", "ru", type=str)
+        current_lang = self.parent().current_language
         self.ru_radio.setChecked(current_lang == "ru")
         self.en_radio.setChecked(current_lang == "en")
         self.ru_radio.toggled.connect(self.change_language)
@@ -998,17 +1761,10 @@ class SettingsDialog(QDialog):
         self.en_radio.setText(self.parent().tr('en_radio'))
         self.close_btn.setText(self.parent().tr('close_btn'))
 
-    def change_theme(self):
-        if self.light_theme_radio.isChecked():
-            theme = "light"
-        elif self.dark_theme_radio.isChecked():
-            theme = "dark"
-        elif self.poisonous_purple_theme_radio.isChecked():
-            theme = "poisonous_purple"
-        elif self.midnight_gold_theme_radio.isChecked():
-            theme = "midnight_gold"
-        else:
-            theme = "dark"
+    def change_theme(self, checked: bool = True):
+        if not checked:
+            return
+        theme = next((theme for radio, theme in self._radio_to_theme.items() if radio.isChecked()), "dark")
         parent = self.parent()
         if parent:
             parent.apply_qss_theme(theme)
@@ -1026,18 +1782,34 @@ class SettingsDialog(QDialog):
         self.update_ui()
 
 class MainWindow(QMainWindow):
+    _MODES = (('replace', 'start_replace_btn'), ('copy1', 'start_copy1_btn'), ('copy2', 'start_copy2_btn'))
+
     def __init__(self):
         super().__init__()
         self.folder_selected = False
-        self.logs = []
-        self.worker = None
-        self.worker_thread = None
+        self.folder_path = None
+        self.logs = deque(maxlen=10000)
+        self.worker_running = False
         self.log_dialog = None
+        self.current_theme = None
+        self._ignored_paths = []
+        self._ignored_set = set()
+        self._log_ts_sec = 0
+        self._log_ts = ""
         self.settings = QSettings("Replitex Team", "Replitex")
         self.current_language = self.settings.value("language", "ru", type=str)
         self.init_ui()
         theme = self.settings.value("theme", "dark", type=str)
         self.apply_qss_theme(theme)
+        self.worker = FileProcessorWorker()
+        self.worker_thread = QThread(self)
+        self.worker.moveToThread(self.worker_thread)
+        unique = Qt.ConnectionType.UniqueConnection
+        self.worker.status_updated.connect(self.status_label.setText, unique)
+        self.worker.log_batch.connect(self._add_logs, unique)
+        self.worker.preview_ready.connect(self._show_preview_dialog, unique)
+        self.worker.finished.connect(self._on_worker_finished, unique)
+        self.worker_thread.start()
 
     def tr(self, key):
         return LANGUAGES[key][self.current_language]
@@ -1063,7 +1835,7 @@ class MainWindow(QMainWindow):
         self.folder_group = QGroupBox(self.tr('folder_group'))
         folder_layout = QHBoxLayout(self.folder_group)
         self.folder_path_label = QLabel(self.tr('folder_not_selected'))
-        self.folder_path_label.setStyleSheet("color: #888888; font-style: italic;")
+        self.folder_path_label.setObjectName("folderPathLabel")
         folder_layout.addWidget(self.folder_path_label)
         self.select_folder_btn = QPushButton(self.tr('select_folder_btn'))
         self.select_folder_btn.clicked.connect(self.select_folder)
@@ -1073,6 +1845,11 @@ class MainWindow(QMainWindow):
         replace_layout = QFormLayout(self.replace_group)
         self.find_input = QLineEdit()
         self.find_input.setPlaceholderText(self.tr('find_placeholder'))
+        self._ui_state_timer = QTimer(self)
+        self._ui_state_timer.setSingleShot(True)
+        self._ui_state_timer.setInterval(50)
+        self._ui_state_timer.timeout.connect(self._update_ui_state)
+        self.find_input.textChanged.connect(lambda: self._ui_state_timer.start())
         self.find_label = QLabel(self.tr('find_label'))
         replace_layout.addRow(self.find_label, self.find_input)
         self.replace_input = QLineEdit()
@@ -1099,6 +1876,7 @@ class MainWindow(QMainWindow):
         self.ignored_paths_list.setHeaderLabels(self.tr('ignored_paths_headers'))
         self.ignored_paths_list.setMaximumHeight(120)
         self.ignored_paths_list.setAlternatingRowColors(True)
+        self.ignored_paths_list.setUniformRowHeights(True)
         paths_controls_layout.addWidget(self.ignored_paths_list)
         paths_buttons_layout = QVBoxLayout()
         self.add_folder_btn = QPushButton(self.tr('add_folder_btn'))
@@ -1135,9 +1913,9 @@ class MainWindow(QMainWindow):
         self.copy1_radio = QRadioButton(self.tr('copy1_radio'))
         self.copy2_radio = QRadioButton(self.tr('copy2_radio'))
         self.replace_radio.setChecked(True)
-        self.mode_button_group.addButton(self.replace_radio)
-        self.mode_button_group.addButton(self.copy1_radio)
-        self.mode_button_group.addButton(self.copy2_radio)
+        self.mode_button_group.addButton(self.replace_radio, 0)
+        self.mode_button_group.addButton(self.copy1_radio, 1)
+        self.mode_button_group.addButton(self.copy2_radio, 2)
         mode_layout.addWidget(self.replace_radio)
         mode_layout.addWidget(self.copy1_radio)
         mode_layout.addWidget(self.copy2_radio)
@@ -1160,7 +1938,11 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(separator)
         status_layout = QHBoxLayout()
         self.status_label = QLabel(self.tr('status_ready'))
-        self.status_label.setStyleSheet("padding: 5px; color: #00aa00;")
+        self.status_label.setObjectName("statusLabel")
+        self._reset_timer = QTimer(self)
+        self._reset_timer.setSingleShot(True)
+        self._reset_timer.setInterval(5000)
+        self._reset_timer.timeout.connect(self._reset_status)
         status_layout.addWidget(self.status_label)
         status_layout.addStretch()
         self.settings_btn = QPushButton("⚙️")
@@ -1168,9 +1950,13 @@ class MainWindow(QMainWindow):
         self.settings_btn.clicked.connect(self.show_settings)
         status_layout.addWidget(self.settings_btn)
         main_layout.addLayout(status_layout)
-        self.replace_radio.toggled.connect(self.update_start_button)
-        self.copy1_radio.toggled.connect(self.update_start_button)
-        self.copy2_radio.toggled.connect(self.update_start_button)
+        self.mode_button_group.idToggled.connect(self.update_start_button)
+        self._toggleable = (
+            self.settings_btn, self.select_folder_btn, self.find_input, self.replace_input,
+            self.ignored_words_input, self.add_folder_btn, self.add_file_btn, self.remove_path_btn,
+            self.case_sensitive_cb, self.whole_words_cb, self.include_subfolders_cb,
+            self.ignored_extensions_input, self.replace_radio, self.copy1_radio, self.copy2_radio
+        )
         self.update_start_button()
         self._update_ui_state()
 
@@ -1216,479 +2002,16 @@ class MainWindow(QMainWindow):
         self.update_ui()
 
     def apply_qss_theme(self, theme: str):
-        colors = self._get_theme_colors(theme)
-        style = self._generate_qss(colors)
-        QApplication.instance().setStyleSheet(style)
-        self.folder_path_label.setStyleSheet(f"color: {colors['label_text']}; font-style: italic;")
-        self.status_label.setStyleSheet(f"padding: 5px; color: {colors['status_success']};")
-
-    def _get_theme_colors(self, theme: str) -> Dict[str, str]:
-        if theme == "dark":
-            return {
-                'main_bg': '#2b2b2b',
-                'text_color': '#ffffff',
-                'group_border': '#555555',
-                'group_title': '#ffffff',
-                'button_bg': '#404040',
-                'button_border': '#606060',
-                'button_hover_bg': '#505050',
-                'button_hover_border': '#707070',
-                'button_pressed_bg': '#353535',
-                'button_pressed_border': '#808080',
-                'button_disabled_bg': '#2a2a2a',
-                'button_disabled_border': '#404040',
-                'button_disabled_text': '#666666',
-                'input_bg': '#3a3a3a',
-                'input_border': '#555555',
-                'input_focus_border': '#0078d4',
-                'input_disabled_bg': '#2a2a2a',
-                'input_disabled_text': '#666666',
-                'selection_bg': '#0078d4',
-                'checkbox_bg': '#3a3a3a',
-                'checkbox_border': '#555555',
-                'checkbox_checked_bg': '#0078d4',
-                'checkbox_checked_border': '#0078d4',
-                'checkbox_hover_border': '#999999',
-                'checkbox_disabled_bg': '#2a2a2a',
-                'checkbox_disabled_border': '#404040',
-                'checkbox_disabled_text': '#666666',
-                'label_text': '#ffffff',
-                'text_edit_bg': '#3a3a3a',
-                'text_edit_border': '#555555',
-                'tree_bg': '#3a3a3a',
-                'tree_border': '#555555',
-                'tree_alternate_bg': '#404040',
-                'tree_item_selected_bg': '#0078d4',
-                'tree_item_hover_bg': '#505050',
-                'header_bg': '#404040',
-                'header_border': '#555555',
-                'frame_line': '#555555',
-                'msgbox_bg': '#2b2b2b',
-                'scroll_bg': '#2b2b2b',
-                'scroll_handle_bg': '#555555',
-                'scroll_handle_hover_bg': '#666666',
-                'scroll_handle_pressed_bg': '#777777',
-                'radio_bg': '#3a3a3a',
-                'radio_border': '#555555',
-                'radio_checked_bg': '#0078d4',
-                'radio_checked_border': '#0078d4',
-                'radio_hover_border': '#707070',
-                'status_success': '#00aa00',
-                'status_error': '#ff6666'
-            }
-        elif theme == "light":
-            return {
-                'main_bg': '#f5f5f5',
-                'text_color': '#333333',
-                'group_border': '#cccccc',
-                'group_title': '#333333',
-                'button_bg': '#e0e0e0',
-                'button_border': '#aaaaaa',
-                'button_hover_bg': '#d0d0d0',
-                'button_hover_border': '#999999',
-                'button_pressed_bg': '#c0c0c0',
-                'button_pressed_border': '#888888',
-                'button_disabled_bg': '#e0e0e0',
-                'button_disabled_border': '#cccccc',
-                'button_disabled_text': '#999999',
-                'input_bg': '#ffffff',
-                'input_border': '#cccccc',
-                'input_focus_border': '#3399ff',
-                'input_disabled_bg': '#f0f0f0',
-                'input_disabled_text': '#999999',
-                'selection_bg': '#3399ff',
-                'checkbox_bg': '#ffffff',
-                'checkbox_border': '#cccccc',
-                'checkbox_checked_bg': '#3399ff',
-                'checkbox_checked_border': '#3399ff',
-                'checkbox_hover_border': '#999999',
-                'checkbox_disabled_bg': '#e0e0e0',
-                'checkbox_disabled_border': '#cccccc',
-                'checkbox_disabled_text': '#999999',
-                'label_text': '#333333',
-                'text_edit_bg': '#ffffff',
-                'text_edit_border': '#cccccc',
-                'tree_bg': '#ffffff',
-                'tree_border': '#cccccc',
-                'tree_alternate_bg': '#f0f0f0',
-                'tree_item_selected_bg': '#3399ff',
-                'tree_item_hover_bg': '#e0e0e0',
-                'header_bg': '#e0e0e0',
-                'header_border': '#cccccc',
-                'frame_line': '#cccccc',
-                'msgbox_bg': '#f5f5f5',
-                'scroll_bg': '#f5f5f5',
-                'scroll_handle_bg': '#cccccc',
-                'scroll_handle_hover_bg': '#bbbbbb',
-                'scroll_handle_pressed_bg': '#aaaaaa',
-                'radio_bg': '#ffffff',
-                'radio_border': '#cccccc',
-                'radio_checked_bg': '#3399ff',
-                'radio_checked_border': '#3399ff',
-                'radio_hover_border': '#999999',
-                'status_success': '#00aa00',
-                'status_error': '#ff6666'
-            }
-        elif theme == "poisonous_purple":
-            return {
-                'main_bg': '#592563',
-                'text_color': '#ffffff',
-                'group_border': '#b049c4',
-                'group_title': '#a4db59',
-                'button_bg': '#000000',
-                'button_border': '#c753dd',
-                'button_hover_bg': '#a645b8',
-                'button_hover_border': '#e860ff',
-                'button_pressed_bg': '#6e2e7a',
-                'button_pressed_border': '#ff6eff',
-                'button_disabled_bg': '#572461',
-                'button_disabled_border': '#843793',
-                'button_disabled_text': '#d358eb',
-                'input_bg': '#783286',
-                'input_border': '#b049c4',
-                'input_focus_border': '#a4db59',
-                'input_disabled_bg': '#572461',
-                'input_disabled_text': '#d358eb',
-                'selection_bg': '#a4db59',
-                'checkbox_bg': '#783286',
-                'checkbox_border': '#b049c4',
-                'checkbox_checked_bg': '#a4db59',
-                'checkbox_checked_border': '#a4db59',
-                'checkbox_hover_border': '#ff84ff',
-                'checkbox_disabled_bg': '#572461',
-                'checkbox_disabled_border': '#843793',
-                'checkbox_disabled_text': '#d358eb',
-                'label_text': '#ffffff',
-                'text_edit_bg': '#783286',
-                'text_edit_border': '#b049c4',
-                'tree_bg': '#783286',
-                'tree_border': '#b049c4',
-                'tree_alternate_bg': '#843793',
-                'tree_item_selected_bg': '#a4db59',
-                'tree_item_hover_bg': '#a645b8',
-                'header_bg': '#843793',
-                'header_border': '#b049c4',
-                'frame_line': '#b049c4',
-                'msgbox_bg': '#592563',
-                'scroll_bg': '#592563',
-                'scroll_handle_bg': '#b049c4',
-                'scroll_handle_hover_bg': '#d358eb',
-                'scroll_handle_pressed_bg': '#f666ff',
-                'radio_bg': '#783286',
-                'radio_border': '#b049c4',
-                'radio_checked_bg': '#a4db59',
-                'radio_checked_border': '#a4db59',
-                'radio_hover_border': '#e860ff',
-                'status_success': '#00aa00',
-                'status_error': '#ff6666'
-            }
-        elif theme == "midnight_gold":
-            return {
-                'main_bg': '#1a1f3a',
-                'text_color': '#ffffff',
-                'group_border': '#4a5a8a',
-                'group_title': '#ffd700',
-                'button_bg': '#2c3a6b',
-                'button_border': '#4a5a8a',
-                'button_hover_bg': '#3d4b7c',
-                'button_hover_border': '#5a6a9a',
-                'button_pressed_bg': '#1f2d5e',
-                'button_pressed_border': '#6a7aaa',
-                'button_disabled_bg': '#141829',
-                'button_disabled_border': '#2c3a6b',
-                'button_disabled_text': '#5a6a9a',
-                'input_bg': '#243456',
-                'input_border': '#4a5a8a',
-                'input_focus_border': '#ffd700',
-                'input_disabled_bg': '#141829',
-                'input_disabled_text': '#5a6a9a',
-                'selection_bg': '#ffd700',
-                'checkbox_bg': '#243456',
-                'checkbox_border': '#4a5a8a',
-                'checkbox_checked_bg': '#ffd700',
-                'checkbox_checked_border': '#ffed4a',
-                'checkbox_hover_border': '#8a9aca',
-                'checkbox_disabled_bg': '#141829',
-                'checkbox_disabled_border': '#2c3a6b',
-                'checkbox_disabled_text': '#5a6a9a',
-                'label_text': '#ffffff',
-                'text_edit_bg': '#243456',
-                'text_edit_border': '#4a5a8a',
-                'tree_bg': '#243456',
-                'tree_border': '#4a5a8a',
-                'tree_alternate_bg': '#2c3a6b',
-                'tree_item_selected_bg': '#ffd700',
-                'tree_item_hover_bg': '#3d4b7c',
-                'header_bg': '#2c3a6b',
-                'header_border': '#4a5a8a',
-                'frame_line': '#4a5a8a',
-                'msgbox_bg': '#1a1f3a',
-                'scroll_bg': '#1a1f3a',
-                'scroll_handle_bg': '#4a5a8a',
-                'scroll_handle_hover_bg': '#5a6a9a',
-                'scroll_handle_pressed_bg': '#6a7aaa',
-                'radio_bg': '#243456',
-                'radio_border': '#4a5a8a',
-                'radio_checked_bg': '#ffd700',
-                'radio_checked_border': '#ffed4a',
-                'radio_hover_border': '#5a6a9a',
-                'status_success': '#00ff88',
-                'status_error': '#ff4466'
-            }
-        else:
-            return self._get_theme_colors("dark")
-
-    def _generate_qss(self, colors: Dict[str, str]) -> str:
-        return f"""
-            QMainWindow, QDialog, QWidget {{
-                background-color: {colors['main_bg']};
-                color: {colors['text_color']};
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 9pt;
-            }}
-            QGroupBox {{
-                font-weight: bold;
-                border: 2px solid {colors['group_border']};
-                border-radius: 8px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 10px 0 10px;
-                color: {colors['group_title']};
-            }}
-            QPushButton {{
-                background-color: {colors['button_bg']};
-                border: 1px solid {colors['button_border']};
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-weight: bold;
-                min-width: 80px;
-            }}
-            QPushButton:hover {{
-                background-color: {colors['button_hover_bg']};
-                border-color: {colors['button_hover_border']};
-            }}
-            QPushButton:pressed {{
-                background-color: {colors['button_pressed_bg']};
-                border-color: {colors['button_pressed_border']};
-            }}
-            QPushButton:disabled {{
-                background-color: {colors['button_disabled_bg']};
-                border-color: {colors['button_disabled_border']};
-                color: {colors['button_disabled_text']};
-            }}
-            QPushButton#settings_btn {{
-                background-color: {colors['button_bg']};
-                border: 1px solid {colors['button_border']};
-                border-radius: 15px;
-                font-size: 16pt;
-                padding: 0;
-                min-width: 30px;
-                max-width: 30px;
-                min-height: 30px;
-                max-height: 30px;
-            }}
-            QPushButton#settings_btn:hover {{
-                background-color: {colors['button_hover_bg']};
-                border-color: {colors['button_hover_border']};
-            }}
-            QPushButton#settings_btn:pressed {{
-                background-color: {colors['button_pressed_bg']};
-                border-color: {colors['button_pressed_border']};
-            }}
-            QLineEdit {{
-                background-color: {colors['input_bg']};
-                border: 1px solid {colors['input_border']};
-                border-radius: 4px;
-                padding: 6px;
-                selection-background-color: {colors['selection_bg']};
-            }}
-            QLineEdit:focus {{
-                border-color: {colors['input_focus_border']};
-            }}
-            QLineEdit:disabled {{
-                background-color: {colors['input_disabled_bg']};
-                color: {colors['input_disabled_text']};
-            }}
-            QCheckBox {{
-                spacing: 8px;
-            }}
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-                border: 1px solid {colors['checkbox_border']};
-                background-color: {colors['checkbox_bg']};
-                border-radius: 2px;
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {colors['checkbox_checked_bg']};
-                border-color: {colors['checkbox_checked_border']};
-                image: url(:/check.png);
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {colors['checkbox_hover_border']};
-            }}
-            QCheckBox:disabled {{
-                color: {colors['checkbox_disabled_text']};
-            }}
-            QCheckBox::indicator:disabled {{
-                background-color: {colors['checkbox_disabled_bg']};
-                border-color: {colors['checkbox_disabled_border']};
-            }}
-            QCheckBox#theme_toggle::indicator {{
-                width: 40px;
-                height: 20px;
-                border-radius: 10px;
-                background-color: {colors['checkbox_border']};
-                border: 1px solid {colors['checkbox_hover_border']};
-            }}
-            QCheckBox#theme_toggle::indicator:checked {{
-                background-color: {colors['checkbox_checked_bg']};
-                border: 1px solid {colors['checkbox_checked_border']};
-            }}
-            QCheckBox#theme_toggle::indicator::subcontrol {{
-                width: 16px;
-                height: 16px;
-                border-radius: 8px;
-                background-color: {colors['text_color']};
-                border: 1px solid {colors['checkbox_border']};
-                subcontrol-origin: padding;
-                subcontrol-position: right center;
-                padding-right: 3px;
-                padding-top: 2px;
-            }}
-            QCheckBox#theme_toggle::indicator:checked::subcontrol {{
-                padding-right: 21px;
-                padding-left: 3px;
-            }}
-            QCheckBox#theme_toggle::indicator:hover {{
-                border-color: {colors['checkbox_hover_border']};
-            }}
-            QCheckBox#theme_toggle::indicator:disabled {{
-                background-color: {colors['checkbox_disabled_bg']};
-                border-color: {colors['checkbox_disabled_border']};
-            }}
-            QLabel {{
-                color: {colors['label_text']};
-            }}
-            QTextEdit {{
-                background-color: {colors['text_edit_bg']};
-                border: 1px solid {colors['text_edit_border']};
-                border-radius: 4px;
-                selection-background-color: {colors['selection_bg']};
-                font-family: 'Consolas', 'Courier New', monospace;
-            }}
-            QTreeWidget {{
-                background-color: {colors['tree_bg']};
-                border: 1px solid {colors['tree_border']};
-                border-radius: 4px;
-                selection-background-color: {colors['tree_item_selected_bg']};
-                alternate-background-color: {colors['tree_alternate_bg']};
-            }}
-            QTreeWidget::item {{
-                padding: 4px;
-                border: none;
-            }}
-            QTreeWidget::item:selected {{
-                background-color: {colors['tree_item_selected_bg']};
-            }}
-            QTreeWidget::item:hover {{
-                background-color: {colors['tree_item_hover_bg']};
-            }}
-            QHeaderView::section {{
-                background-color: {colors['header_bg']};
-                border: 1px solid {colors['header_border']};
-                padding: 6px;
-                font-weight: bold;
-            }}
-            QFrame[frameShape="4"] {{
-                border: none;
-                border-top: 1px solid {colors['frame_line']};
-            }}
-            QMessageBox {{
-                background-color: {colors['msgbox_bg']};
-            }}
-            QMessageBox QPushButton {{
-                min-width: 60px;
-                padding: 6px 12px;
-            }}
-            QScrollArea {{
-                background-color: {colors['scroll_bg']};
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                background-color: {colors['scroll_bg']};
-                width: 12px;
-                border-radius: 6px;
-                margin: 0;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {colors['scroll_handle_bg']};
-                border-radius: 6px;
-                min-height: 20px;
-                margin: 2px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {colors['scroll_handle_hover_bg']};
-            }}
-            QScrollBar::handle:vertical:pressed {{
-                background-color: {colors['scroll_handle_pressed_bg']};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                border: none;
-                background: none;
-                height: 0px;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: none;
-            }}
-            QScrollBar:horizontal {{
-                background-color: {colors['scroll_bg']};
-                height: 12px;
-                border-radius: 6px;
-                margin: 0;
-            }}
-            QScrollBar::handle:horizontal {{
-                background-color: {colors['scroll_handle_bg']};
-                border-radius: 6px;
-                min-width: 20px;
-                margin: 2px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background-color: {colors['scroll_handle_hover_bg']};
-            }}
-            QScrollBar::handle:horizontal:pressed {{
-                background-color: {colors['scroll_handle_pressed_bg']};
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                border: none;
-                background: none;
-                width: 0px;
-            }}
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
-                background: none;
-            }}
-            QRadioButton {{
-                spacing: 8px;
-            }}
-            QRadioButton::indicator {{
-                width: 16px;
-                height: 16px;
-                border-radius: 8px;
-                border: 1px solid {colors['radio_border']};
-                background-color: {colors['radio_bg']};
-            }}
-            QRadioButton::indicator:checked {{
-                background-color: {colors['radio_checked_bg']};
-                border-color: {colors['radio_checked_border']};
-            }}
-            QRadioButton::indicator:hover {{
-                border-color: {colors['radio_hover_border']};
-            }}
-            """
+        if theme == self.current_theme:
+            return
+        self.current_theme = theme
+        QApplication.instance().setStyleSheet(_get_theme_qss(theme))
+
+    def _set_state(self, widget: QWidget, name: str, value: str):
+        if widget.property(name) != value:
+            widget.setProperty(name, value)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
 
     def show_settings(self):
         dialog = SettingsDialog(self)
@@ -1696,12 +2019,7 @@ class MainWindow(QMainWindow):
         dialog.exec()
 
     def update_start_button(self):
-        if self.replace_radio.isChecked():
-            self.start_btn.setText(self.tr('start_replace_btn'))
-        elif self.copy1_radio.isChecked():
-            self.start_btn.setText(self.tr('start_copy1_btn'))
-        else:
-            self.start_btn.setText(self.tr('start_copy2_btn'))
+        self.start_btn.setText(self.tr(self._MODES[self.mode_button_group.checkedId()][1]))
 
     def select_folder(self):
         folder = QFileDialog.getExistingDirectory(
@@ -1712,32 +2030,23 @@ class MainWindow(QMainWindow):
         if folder:
             self.folder_path = folder
             self.folder_path_label.setText(folder)
-            theme = self.settings.value("theme", "dark", type=str)
-            colors = self._get_theme_colors(theme)
-            self.folder_path_label.setStyleSheet(f"color: {colors['label_text']};")
+            self._set_state(self.folder_path_label, "selected", "true")
             self.folder_selected = True
             self._update_ui_state()
 
     def _update_ui_state(self):
-        has_folder = hasattr(self, 'folder_path')
+        if self.worker_running:
+            return
+        has_folder = self.folder_path is not None
         has_find_text = bool(self.find_input.text().strip())
         self.preview_btn.setEnabled(has_folder and has_find_text)
         self.start_btn.setEnabled(has_folder and has_find_text)
-        self.find_input.textChanged.connect(self._update_ui_state)
 
     def _get_ignored_extensions(self) -> List[str]:
-        text = self.ignored_extensions_input.text().strip()
-        if not text:
-            return []
-        extensions = [ext.strip() for ext in text.split(',')]
-        return [ext if ext.startswith('.') else f'.{ext}' for ext in extensions if ext]
+        return list(_parse_extensions(self.ignored_extensions_input.text()))
 
     def _get_ignored_words(self) -> List[str]:
-        text = self.ignored_words_input.text().strip()
-        if not text:
-            return []
-        words = [word.strip() for word in text.split(',')]
-        return [word for word in words if word]
+        return list(_parse_words(self.ignored_words_input.text()))
 
     def add_ignored_folder(self):
         folder = QFileDialog.getExistingDirectory(
@@ -1746,11 +2055,11 @@ class MainWindow(QMainWindow):
             os.path.expanduser("~")
         )
         if folder:
-            for i in range(self.ignored_paths_list.topLevelItemCount()):
-                item = self.ignored_paths_list.topLevelItem(i)
-                if item.text(0) == folder:
-                    QMessageBox.information(self, self.tr('info_title'), self.tr('path_already_added_folder'))
-                    return
+            if folder in self._ignored_set:
+                QMessageBox.information(self, self.tr('info_title'), self.tr('path_already_added_folder'))
+                return
+            self._ignored_set.add(folder)
+            self._ignored_paths.append(folder)
             item = QTreeWidgetItem(self.ignored_paths_list)
             item.setText(0, folder)
             item.setText(1, self.tr('folder_type'))
@@ -1763,11 +2072,11 @@ class MainWindow(QMainWindow):
             self.tr('all_files')
         )
         if file_path:
-            for i in range(self.ignored_paths_list.topLevelItemCount()):
-                item = self.ignored_paths_list.topLevelItem(i)
-                if item.text(0) == file_path:
-                    QMessageBox.information(self, self.tr('info_title'), self.tr('path_already_added_file'))
-                    return
+            if file_path in self._ignored_set:
+                QMessageBox.information(self, self.tr('info_title'), self.tr('path_already_added_file'))
+                return
+            self._ignored_set.add(file_path)
+            self._ignored_paths.append(file_path)
             item = QTreeWidgetItem(self.ignored_paths_list)
             item.setText(0, file_path)
             item.setText(1, self.tr('file_type'))
@@ -1783,21 +2092,21 @@ class MainWindow(QMainWindow):
                 QMessageBox.StandardButton.No
             )
             if reply == QMessageBox.StandardButton.Yes:
+                path = current_item.text(0)
+                self._ignored_set.discard(path)
+                self._ignored_paths.remove(path)
                 root = self.ignored_paths_list.invisibleRootItem()
                 root.removeChild(current_item)
 
     def _get_ignored_paths(self) -> List[str]:
-        return [self.ignored_paths_list.topLevelItem(i).text(0) for i in range(self.ignored_paths_list.topLevelItemCount())]
+        return list(self._ignored_paths)
 
     def show_preview(self):
         if not self._validate_inputs():
             return
         self._disable_ui()
         self.status_label.setText(self.tr('creating_preview'))
-        mode = 'replace' if self.replace_radio.isChecked() else 'copy1' if self.copy1_radio.isChecked() else 'copy2'
-        self.worker = FileProcessorWorker()
-        self.worker_thread = QThread()
-        self.worker.moveToThread(self.worker_thread)
+        mode = self._MODES[self.mode_button_group.checkedId()][0]
         self.worker.setup_parameters(
             folder_path=self.folder_path,
             find_text=self.find_input.text(),
@@ -1812,12 +2121,7 @@ class MainWindow(QMainWindow):
             mode=mode,
             lang=self.current_language
         )
-        self.worker.status_updated.connect(self.status_label.setText)
-        self.worker.log_message.connect(self._add_log)
-        self.worker.preview_ready.connect(self._show_preview_dialog)
-        self.worker.finished.connect(self._on_worker_finished)
-        self.worker_thread.started.connect(self.worker.run)
-        self.worker_thread.start()
+        self._run_worker()
 
     def start_processing(self):
         if not self._validate_inputs():
@@ -1833,10 +2137,7 @@ class MainWindow(QMainWindow):
             return
         self._disable_ui()
         self.status_label.setText(self.tr('starting_operation'))
-        mode = 'replace' if self.replace_radio.isChecked() else 'copy1' if self.copy1_radio.isChecked() else 'copy2'
-        self.worker = FileProcessorWorker()
-        self.worker_thread = QThread()
-        self.worker.moveToThread(self.worker_thread)
+        mode = self._MODES[self.mode_button_group.checkedId()][0]
         self.show_logs()
         self.worker.setup_parameters(
             folder_path=self.folder_path,
@@ -1852,19 +2153,18 @@ class MainWindow(QMainWindow):
             mode=mode,
             lang=self.current_language
         )
-        self.worker.status_updated.connect(self.status_label.setText)
-        self.worker.log_message.connect(self._add_log)
-        self.worker.finished.connect(self._on_worker_finished)
-        self.worker_thread.started.connect(self.worker.run)
-        self.worker_thread.start()
+        self._run_worker()
+
+    def _run_worker(self):
+        self.worker_running = True
+        QMetaObject.invokeMethod(self.worker, "run", Qt.ConnectionType.QueuedConnection)
 
     def show_logs(self):
-        logs_text = '\n'.join(self.logs) if self.logs else self.tr('logs_empty')
         if self.log_dialog and self.log_dialog.isVisible():
-            self.log_dialog.update_logs(logs_text)
             self.log_dialog.raise_()
             self.log_dialog.activateWindow()
             return
+        logs_text = '\n'.join(self.logs) if self.logs else self.tr('logs_empty')
         self.log_dialog = LogViewerDialog(logs_text, self)
         self.log_dialog.show()
 
@@ -1872,7 +2172,7 @@ class MainWindow(QMainWindow):
         self.logs.clear()
 
     def _validate_inputs(self) -> bool:
-        if not hasattr(self, 'folder_path'):
+        if self.folder_path is None:
             QMessageBox.warning(self, self.tr('error_title'), self.tr('select_folder_msg'))
             return False
         if not self.find_input.text().strip():
@@ -1883,52 +2183,42 @@ class MainWindow(QMainWindow):
             return False
         return True
 
+    def _set_controls_enabled(self, enabled: bool):
+        self.setUpdatesEnabled(False)
+        for widget in self._toggleable:
+            if widget.isEnabled() != enabled:
+                widget.setEnabled(enabled)
+        self.setUpdatesEnabled(True)
+
     def _disable_ui(self):
-        self.settings_btn.setEnabled(False)
-        self.select_folder_btn.setEnabled(False)
+        self._ui_state_timer.stop()
+        self._reset_timer.stop()
+        self._set_state(self.status_label, "state", "success")
+        self._set_controls_enabled(False)
         self.preview_btn.setEnabled(False)
         self.start_btn.setEnabled(False)
-        self.find_input.setEnabled(False)
-        self.replace_input.setEnabled(False)
-        self.ignored_words_input.setEnabled(False)
-        self.add_folder_btn.setEnabled(False)
-        self.add_file_btn.setEnabled(False)
-        self.remove_path_btn.setEnabled(False)
-        self.case_sensitive_cb.setEnabled(False)
-        self.whole_words_cb.setEnabled(False)
-        self.include_subfolders_cb.setEnabled(False)
-        self.ignored_extensions_input.setEnabled(False)
-        self.replace_radio.setEnabled(False)
-        self.copy1_radio.setEnabled(False)
-        self.copy2_radio.setEnabled(False)
 
     def _enable_ui(self):
-        self.settings_btn.setEnabled(True)
-        self.select_folder_btn.setEnabled(True)
-        self.find_input.setEnabled(True)
-        self.replace_input.setEnabled(True)
-        self.ignored_words_input.setEnabled(True)
-        self.add_folder_btn.setEnabled(True)
-        self.add_file_btn.setEnabled(True)
-        self.remove_path_btn.setEnabled(True)
-        self.case_sensitive_cb.setEnabled(True)
-        self.whole_words_cb.setEnabled(True)
-        self.include_subfolders_cb.setEnabled(True)
-        self.ignored_extensions_input.setEnabled(True)
-        self.replace_radio.setEnabled(True)
-        self.copy1_radio.setEnabled(True)
-        self.copy2_radio.setEnabled(True)
+        self._set_controls_enabled(True)
         self._update_ui_state()
 
-    def _add_log(self, message: str):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
-        self.logs.append(log_entry)
+    def _add_logs(self, messages: List[str]):
+        now = int(time.time())
+        if now != self._log_ts_sec:
+            self._log_ts_sec = now
+            self._log_ts = time.strftime("%H:%M:%S", time.localtime(now))
+        timestamp = self._log_ts
+        entries = [f"[{timestamp}] {message}" for message in messages]
+        self.logs.extend(entries)
         if self.log_dialog and self.log_dialog.isVisible():
-            logs_text = '\n'.join(self.logs)
-            self.log_dialog.update_logs(logs_text)
+            if len(self.logs) == len(entries):
+                self.log_dialog.update_logs('\n'.join(entries))
+            else:
+                self.log_dialog.append_lines(entries)
 
     def _show_preview_dialog(self, matches: List[Dict]):
+        if not self.worker.is_preview_mode:
+            return
         if not matches:
             QMessageBox.information(self, self.tr('preview_title'), self.tr('preview_no_matches'))
             return
@@ -1936,25 +2226,22 @@ class MainWindow(QMainWindow):
         dialog.exec()
 
     def _on_worker_finished(self, success: bool):
-        if self.worker_thread:
-            self.worker_thread.quit()
-            self.worker_thread.wait()
-            self.worker_thread = None
-        self.worker = None
+        self.worker_running = False
         self._enable_ui()
-        theme = self.settings.value("theme", "dark", type=str)
-        colors = self._get_theme_colors(theme)
         if success:
             self.status_label.setText(self.tr('operation_success'))
-            self.status_label.setStyleSheet(f"padding: 5px; color: {colors['status_success']};")
+            self._set_state(self.status_label, "state", "success")
         else:
             self.status_label.setText(self.tr('operation_error'))
-            self.status_label.setStyleSheet(f"padding: 5px; color: {colors['status_error']};")
-        QTimer.singleShot(5000, lambda: self.status_label.setText(self.tr('status_ready')))
-        QTimer.singleShot(5000, lambda: self.status_label.setStyleSheet(f"padding: 5px; color: {colors['status_success']};"))
+            self._set_state(self.status_label, "state", "error")
+        self._reset_timer.start()
+
+    def _reset_status(self):
+        self.status_label.setText(self.tr('status_ready'))
+        self._set_state(self.status_label, "state", "success")
 
     def closeEvent(self, event):
-        if self.worker_thread and self.worker_thread.isRunning():
+        if self.worker_running:
             reply = QMessageBox.question(
                 self,
                 self.tr('confirm_title'),
@@ -1962,17 +2249,13 @@ class MainWindow(QMainWindow):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.No
             )
-            if reply == QMessageBox.StandardButton.Yes:
-                if self.worker:
-                    self.worker.stop_processing()
-                if self.worker_thread:
-                    self.worker_thread.quit()
-                    self.worker_thread.wait(3000)
-                event.accept()
-            else:
+            if reply != QMessageBox.StandardButton.Yes:
                 event.ignore()
-        else:
-            event.accept()
+                return
+            self.worker.stop_processing()
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        event.accept()
 
 def main():
     app = QApplication(sys.argv)